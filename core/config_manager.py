@@ -8,10 +8,131 @@ managing configuration data for the simulation.
 import os
 import yaml
 import logging
+from collections.abc import Mapping
 from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Top-level scenario keys that describe a scenario rather than configure it
+SCENARIO_METADATA_KEYS = ('metadata', 'description')
+
+# Base configuration used when base_config.yaml is missing
+_DEFAULT_BASE_CONFIG = {
+    "simulation": {
+        "time_interval": "MONTHLY",
+        "fiscal_year_start_month": 4,
+        "fiscal_year_start_day": 1
+    },
+    "states": {
+        "eligible_population": {"id": "eligible", "name": "Eligible Population", "reset_on_fiscal_year": False},
+        "re_enrollment_eligible_population": {"id": "re_enrollment_eligible", "name": "Re-enrollment Eligible Population", "reset_on_fiscal_year": False},
+        "applied_population": {"id": "applied", "name": "Applied Population", "reset_on_fiscal_year": False},
+        "enrolled_inactive_population": {"id": "enrolled_inactive", "name": "Enrolled Inactive Population", "reset_on_fiscal_year": True},
+        "active_claimant_population": {"id": "active_claimant", "name": "Active Claimant Population", "reset_on_fiscal_year": True}
+    },
+    "flows": {
+        "new_applications": {"id": "new_applications", "source": "eligible", "target": "applied"},
+        "new_re_enrollment_applications": {"id": "new_re_enrollment_applications", "source": "re_enrollment_eligible", "target": "applied"},
+        "new_enrollments": {"id": "new_enrollments", "source": "applied", "target": "enrolled_inactive"},
+        "new_re_enrollment": {"id": "new_re_enrollment", "source": "applied", "target": "enrolled_inactive"},
+        "new_first_claimants": {"id": "new_first_claimants", "source": "enrolled_inactive", "target": "active_claimant"}
+    }
+}
+
+
+def _deep_update(target, source):
+    """
+    Update a nested dictionary in place, merging nested dictionaries.
+    
+    Uses an explicit stack of (target, source) pairs rather than recursion.
+    
+    Args:
+        target (dict): Target dictionary to update.
+        source (dict): Source dictionary with updated values.
+    """
+    stack = [(target, source)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            target_value = target.get(key)
+            if isinstance(value, dict) and isinstance(target_value, dict):
+                # Merge nested dictionaries on a later iteration
+                stack.append((target_value, value))
+            else:
+                # Directly update value
+                target[key] = value
+
+
+class _LayeredConfig(Mapping):
+    """
+    Read-only view of an overlay dictionary layered on top of a base dictionary.
+    
+    Lookups check the overlay first and fall back to the base. Where both layers
+    hold a dictionary under the same key, the value is another _LayeredConfig
+    over the two sub-dictionaries, so nested sections merge the same way
+    _deep_update would merge them, without copying either layer.
+    """
+    
+    def __init__(self, base, overlay):
+        """
+        Initialize with base and overlay dictionaries.
+        
+        Args:
+            base (dict): Base configuration dictionary.
+            overlay (dict): Overriding configuration dictionary.
+        """
+        self._base = base
+        self._overlay = overlay
+        self._layer_cache = {}  # Maps key to nested _LayeredConfig
+    
+    def __getitem__(self, key):
+        """Return the overlay value for key, falling back to the base."""
+        if key in self._overlay:
+            value = self._overlay[key]
+            if isinstance(value, dict):
+                base_value = self._base.get(key)
+                if isinstance(base_value, dict):
+                    layer = self._layer_cache.get(key)
+                    if layer is None:
+                        layer = _LayeredConfig(base_value, value)
+                        self._layer_cache[key] = layer
+                    return layer
+            return value
+        return self._base[key]
+    
+    def __iter__(self):
+        """Iterate over base keys, then overlay keys not present in the base."""
+        yield from self._base
+        for key in self._overlay:
+            if key not in self._base:
+                yield key
+    
+    def __len__(self):
+        """Return the number of distinct keys across both layers."""
+        return len(self._base) + sum(1 for key in self._overlay if key not in self._base)
+    
+    def __contains__(self, key):
+        """Check whether key is present in either layer."""
+        return key in self._overlay or key in self._base
+    
+    def to_dict(self):
+        """
+        Materialize the layered view as a new plain dictionary.
+        
+        Returns:
+            dict: Merged configuration dictionary.
+        """
+        merged = deepcopy(self._base)
+        _deep_update(merged, self._overlay)
+        return merged
+    
+    def __repr__(self):
+        """Return string representation of the merged configuration."""
+        return f"_LayeredConfig({self.to_dict()!r})"
+
 
 class ConfigurationManager:
     """
@@ -39,6 +160,17 @@ class ConfigurationManager:
         self.rollout_configs = {}
         self.benefit_configs = {}
         
+        # Merged view of base and scenario configuration, built on first use
+        self._merged_cache = None
+        
+        # Resolved lookups keyed by parameter tuples, filled on first use
+        self._flow_rate_index = {}
+        self._distribution_index = {}
+        self._section_cache = {}
+        
+        # Parsed scenario files by name, as ((mtime_ns, size), configuration)
+        self._scenario_cache = {}
+        
         # Initialize with base configuration
         self.load_base_configuration()
     
@@ -51,35 +183,17 @@ class ConfigurationManager:
         """
         base_config_path = os.path.join(self.config_directory, "base_config.yaml")
         try:
-            with open(base_config_path, 'r') as file:
-                self.base_config = yaml.safe_load(file)
+            with open(base_config_path, 'rb') as file:
+                self.base_config = yaml.load(file, Loader=Loader)
             logger.info(f"Loaded base configuration from {base_config_path}")
+            self._invalidate_caches()
             return True
         except FileNotFoundError:
             logger.warning(f"Base configuration file not found at {base_config_path}")
-            # Initialize with empty configuration
-            self.base_config = {
-                "simulation": {
-                    "time_interval": "MONTHLY",
-                    "fiscal_year_start_month": 4,
-                    "fiscal_year_start_day": 1
-                },
-                "states": {
-                    "eligible_population": {"id": "eligible", "name": "Eligible Population", "reset_on_fiscal_year": False},
-                    "re_enrollment_eligible_population": {"id": "re_enrollment_eligible", "name": "Re-enrollment Eligible Population", "reset_on_fiscal_year": False},
-                    "applied_population": {"id": "applied", "name": "Applied Population", "reset_on_fiscal_year": False},
-                    "enrolled_inactive_population": {"id": "enrolled_inactive", "name": "Enrolled Inactive Population", "reset_on_fiscal_year": True},
-                    "active_claimant_population": {"id": "active_claimant", "name": "Active Claimant Population", "reset_on_fiscal_year": True}
-                },
-                "flows": {
-                    "new_applications": {"id": "new_applications", "source": "eligible", "target": "applied"},
-                    "new_re_enrollment_applications": {"id": "new_re_enrollment_applications", "source": "re_enrollment_eligible", "target": "applied"},
-                    "new_enrollments": {"id": "new_enrollments", "source": "applied", "target": "enrolled_inactive"},
-                    "new_re_enrollment": {"id": "new_re_enrollment", "source": "applied", "target": "enrolled_inactive"},
-                    "new_first_claimants": {"id": "new_first_claimants", "source": "enrolled_inactive", "target": "active_claimant"}
-                }
-            }
+            # Initialize with a copy of the defaults so edits stay per-instance
+            self.base_config = deepcopy(_DEFAULT_BASE_CONFIG)
             logger.info("Initialized with default base configuration")
+            self._invalidate_caches()
             return False
     
     def load_scenario_configuration(self, scenario_name):
@@ -92,54 +206,87 @@ class ConfigurationManager:
         Returns:
             bool: True if loading was successful, False otherwise.
         """
-        self.scenario_name = scenario_name
         scenario_path = os.path.join(self.config_directory, "scenarios", f"{scenario_name}.yaml")
+        previous_name = self.scenario_name
+        self.scenario_name = scenario_name
         
         try:
-            with open(scenario_path, 'r') as file:
-                self.scenario_config = yaml.safe_load(file)
-            logger.info(f"Loaded scenario configuration from {scenario_path}")
+            # Size as well as nanosecond mtime, so a rewrite within the
+            # filesystem's timestamp resolution is still picked up
+            stat = os.stat(scenario_path)
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._scenario_cache.get(scenario_name)
+            
+            # Reloading the active, unchanged scenario keeps all derived caches
+            if (cached is not None and cached[0] == file_key and
+                    previous_name == scenario_name and self.scenario_config is cached[1]):
+                logger.debug(f"Scenario configuration {scenario_name} is unchanged")
+                return True
+            
+            # Reuse the parsed scenario if the file is unchanged since last read
+            if cached is not None and cached[0] == file_key:
+                self.scenario_config = cached[1]
+                logger.info(f"Loaded scenario configuration from cache for {scenario_path}")
+            else:
+                with open(scenario_path, 'rb') as file:
+                    self.scenario_config = yaml.load(file, Loader=Loader)
+                self._scenario_cache[scenario_name] = (file_key, self.scenario_config)
+                logger.info(f"Loaded scenario configuration from {scenario_path}")
+            
+            self._invalidate_caches()
             return True
         except FileNotFoundError:
             logger.warning(f"Scenario configuration file not found at {scenario_path}")
             self.scenario_config = {}
+            self._invalidate_caches()
             return False
     
+    def _invalidate_caches(self):
+        """Discard the merged configuration and lookup indexes after a reload."""
+        self._merged_cache = None
+        self._flow_rate_index = {}
+        self._distribution_index = {}
+        self._section_cache = {}
+    
     def get_merged_config(self):
         """
         Get configuration with scenario overrides applied to base configuration.
         
+        The merged configuration is a read-only layered view over the loaded
+        base and scenario dictionaries, built once and cached until either is
+        reloaded. Use ``to_dict()`` on the result for a mutable copy.
+        
         Returns:
-            dict: Merged configuration dictionary.
+            Mapping: Merged configuration mapping.
         """
-        # Create a deep copy of the base configuration
-        merged_config = deepcopy(self.base_config)
-        
-        # Apply scenario overrides, if any
-        if self.scenario_config:
-            self._deep_update(merged_config, self.scenario_config)
+        if self._merged_cache is None:
+            self._merged_cache = _LayeredConfig(self.base_config, self.scenario_config or {})
         
-        return merged_config
+        return self._merged_cache
     
-    def _deep_update(self, target, source):
+    def get_flow_rate(self, flow_id, segment_type, age_bracket):
         """
-        Recursively update a nested dictionary.
+        Get flow rate for specified parameters.
         
         Args:
-            target (dict): Target dictionary to update.
-            source (dict): Source dictionary with updated values.
+            flow_id (str): Identifier for the flow.
+            segment_type (str): Type of population segment.
+            age_bracket (str): Age bracket identifier.
+            
+        Returns:
+            float: Flow rate for the specified parameters.
         """
-        for key, value in source.items():
-            if isinstance(value, dict) and key in target and isinstance(target[key], dict):
-                # Recursively update nested dictionaries
-                self._deep_update(target[key], value)
-            else:
-                # Directly update value
-                target[key] = value
+        index_key = (flow_id, segment_type, age_bracket)
+        try:
+            return self._flow_rate_index[index_key]
+        except KeyError:
+            rate = self._lookup_flow_rate(flow_id, segment_type, age_bracket)
+            self._flow_rate_index[index_key] = rate
+            return rate
     
-    def get_flow_rate(self, flow_id, segment_type, age_bracket):
+    def _lookup_flow_rate(self, flow_id, segment_type, age_bracket):
         """
-        Get flow rate for specified parameters.
+        Resolve flow rate from configuration, most specific key first.
         
         Args:
             flow_id (str): Identifier for the flow.
@@ -176,6 +323,25 @@ class ConfigurationManager:
         """
         Get statistical distribution parameters.
         
+        Args:
+            dist_id (str): Distribution identifier.
+            segment_type (str): Type of population segment.
+            
+        Returns:
+            dict: Distribution parameters.
+        """
+        index_key = (dist_id, segment_type)
+        try:
+            return self._distribution_index[index_key]
+        except KeyError:
+            params = self._lookup_distribution_parameters(dist_id, segment_type)
+            self._distribution_index[index_key] = params
+            return params
+    
+    def _lookup_distribution_parameters(self, dist_id, segment_type):
+        """
+        Resolve distribution parameters from configuration.
+        
         Args:
             dist_id (str): Distribution identifier.
             segment_type (str): Type of population segment.
@@ -201,6 +367,24 @@ class ConfigurationManager:
         # Default to uniform distribution
         return {"type": "uniform", "params": {"min": 0.0, "max": 1.0}}
     
+    def _get_section(self, section, default):
+        """
+        Get a top-level section of the merged configuration, memoized.
+        
+        Args:
+            section (str): Name of the configuration section.
+            default: Value to use when the section is not configured.
+            
+        Returns:
+            The configuration section, or the default.
+        """
+        try:
+            return self._section_cache[section]
+        except KeyError:
+            value = self.get_merged_config().get(section, default)
+            self._section_cache[section] = value
+            return value
+    
     def get_state_definitions(self):
         """
         Get process state definitions from configuration.
@@ -208,8 +392,7 @@ class ConfigurationManager:
         Returns:
             dict: Dictionary of state definitions.
         """
-        merged_config = self.get_merged_config()
-        return merged_config.get('states', {})
+        return self._get_section('states', {})
     
     def get_flow_definitions(self):
         """
@@ -218,8 +401,7 @@ class ConfigurationManager:
         Returns:
             dict: Dictionary of flow definitions.
         """
-        merged_config = self.get_merged_config()
-        return merged_config.get('flows', {})
+        return self._get_section('flows', {})
     
     def get_simulation_parameters(self):
         """
@@ -228,8 +410,7 @@ class ConfigurationManager:
         Returns:
             dict: Dictionary of simulation parameters.
         """
-        merged_config = self.get_merged_config()
-        return merged_config.get('simulation', {})
+        return self._get_section('simulation', {})
     
     def get_population_segments(self):
         """
@@ -238,8 +419,7 @@ class ConfigurationManager:
         Returns:
             list: List of population segment definitions.
         """
-        merged_config = self.get_merged_config()
-        return merged_config.get('population_segments', [])
+        return self._get_section('population_segments', [])
     
     def get_regions(self):
         """
@@ -248,8 +428,21 @@ class ConfigurationManager:
         Returns:
             list: List of region definitions.
         """
+        return self._get_section('regions', [])
+    
+    def get_setup_sections(self):
+        """
+        Get the configuration sections needed to set up a simulation in one call.
+        
+        Returns:
+            tuple: (simulation parameters, region definitions,
+                population segment definitions, state definitions).
+        """
         merged_config = self.get_merged_config()
-        return merged_config.get('regions', [])
+        return (merged_config.get('simulation', {}),
+                merged_config.get('regions', []),
+                merged_config.get('population_segments', []),
+                merged_config.get('states', {}))
     
     def validate_configuration(self):
         """
@@ -277,7 +470,7 @@ class ConfigurationManager:
         states = merged_config['states']
         flows = merged_config['flows']
         
-        state_ids = [state['id'] for state in states.values()]
+        state_ids = {state['id'] for state in states.values()}
         
         for flow_id, flow in flows.items():
             if 'source' not in flow or 'target' not in flow:
@@ -294,6 +487,105 @@ class ConfigurationManager:
         
         return True
     
+    def peek_scenario_metadata(self, scenario_name, max_events=1000):
+        """
+        Read the descriptive metadata of a scenario without loading all of it.
+        
+        The scenario file is scanned as a stream of YAML events, and only the
+        top-level 'metadata' and 'description' entries are constructed. The
+        scan stops once both have been read, so the bulk of a large scenario
+        is never built. If the entries are not found within max_events events,
+        the whole file is loaded instead.
+        
+        Args:
+            scenario_name (str): Name of the scenario to inspect.
+            max_events (int): Number of parse events to scan before falling
+                back to a full load.
+            
+        Returns:
+            dict: The metadata entries present in the scenario file.
+        """
+        scenario_path = os.path.join(self.config_directory, "scenarios", f"{scenario_name}.yaml")
+        
+        try:
+            with open(scenario_path, 'rb') as file:
+                metadata = self._scan_scenario_metadata(file, max_events)
+                if metadata is not None:
+                    return metadata
+                
+                # Markers not found within max_events; load the whole file
+                file.seek(0)
+                scenario_config = yaml.load(file, Loader=Loader) or {}
+        except FileNotFoundError:
+            logger.warning(f"Scenario configuration file not found at {scenario_path}")
+            return {}
+        
+        return {key: scenario_config[key] for key in SCENARIO_METADATA_KEYS
+                if key in scenario_config}
+    
+    def _scan_scenario_metadata(self, file, max_events):
+        """
+        Scan YAML parse events for top-level metadata entries.
+        
+        Args:
+            file (file): Binary file object positioned at the start of the document.
+            max_events (int): Maximum number of events to scan.
+            
+        Returns:
+            dict: The metadata entries found, or None if the scan was cut short
+                by max_events before reaching the end of the top-level mapping.
+        """
+        metadata = {}
+        depth = 0
+        key = None
+        captured = None  # Events of the metadata value being read
+        
+        for count, event in enumerate(yaml.parse(file, Loader=Loader)):
+            if count >= max_events:
+                return None
+            
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+            
+            if captured is not None:
+                captured.append(event)
+                if depth == 1:
+                    metadata[key] = self._construct_from_events(captured)
+                    captured = None
+                    key = None
+                    if len(metadata) == len(SCENARIO_METADATA_KEYS):
+                        return metadata
+            elif depth == 0 and count > 2:
+                # End of the top-level mapping (or a non-mapping document)
+                return metadata
+            elif depth == 1:
+                if isinstance(event, yaml.ScalarEvent) and key is None:
+                    key = event.value
+                    if key in SCENARIO_METADATA_KEYS:
+                        captured = []
+                elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent,
+                                        yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    # A top-level value was skipped; next scalar is a key
+                    key = None
+        
+        return metadata
+    
+    def _construct_from_events(self, events):
+        """
+        Construct a Python value from the YAML events of a single node.
+        
+        Args:
+            events (list): Parse events making up one node.
+            
+        Returns:
+            The constructed value.
+        """
+        document = ([yaml.StreamStartEvent(), yaml.DocumentStartEvent()] + events +
+                    [yaml.DocumentEndEvent(), yaml.StreamEndEvent()])
+        return yaml.load(yaml.emit(document), Loader=Loader)
+    
     def list_available_scenarios(self):
         """
         List all available scenarios.
@@ -305,9 +597,7 @@ class ConfigurationManager:
         if not os.path.exists(scenario_dir):
             return []
         
-        scenarios = []
-        for filename in os.listdir(scenario_dir):
-            if filename.endswith(".yaml"):
-                scenarios.append(filename[:-5])  # Remove .yaml extension
-        
-        return scenarios
+        with os.scandir(scenario_dir) as entries:
+            # Remove .yaml extension; skip directories named like scenarios
+            return [entry.name[:-5] for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()]
@@ -5,15 +5,89 @@ This module provides the Simulation class, which orchestrates the entire
 simulation process.
 """
 
+import csv
+import json
 import logging
 import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from core.time_manager import TimeManager
 from core.config_manager import ConfigurationManager
 from population.region import Region
+from process.process_result import ProcessResult
 from stats.statistics_tracker import StatisticsTracker
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for result files, so streamed records are written in large chunks
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def _encode_json(value):
+    """
+    Encode a value as compact JSON bytes, using orjson when available.
+    
+    Args:
+        value: JSON-serializable value; other objects are converted with str().
+        
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=str).encode('utf-8')
+
+
+def _write_results_json(results, json_path):
+    """
+    Write simulation results to a JSON file one metric record at a time.
+    
+    The metrics list is streamed record by record, so the encoded document is
+    never held in memory as a whole. Other top-level entries are written
+    with two-space indentation.
+    
+    Args:
+        results (dict): Simulation results as returned by get_simulation_results.
+        json_path (str): Path of the JSON file to write.
+    """
+    with open(json_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(results.items()):
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(_encode_json(key) + b': ')
+            
+            if key == 'metrics':
+                f.write(b'[')
+                for j, record in enumerate(value):
+                    f.write(b',\n    ' if j else b'\n    ')
+                    f.write(_encode_json(record))
+                f.write(b'\n  ]' if value else b']')
+            else:
+                encoded = json.dumps(value, indent=2, default=str)
+                f.write(encoded.replace('\n', '\n  ').encode('utf-8'))
+        f.write(b'\n}\n')
+
+
+def _write_metrics_ndjson(metrics, ndjson_path):
+    """
+    Write metric records to a newline-delimited JSON file, one record per line.
+    
+    Args:
+        metrics (list): Normalized metric records.
+        ndjson_path (str): Path of the NDJSON file to write.
+    """
+    with open(ndjson_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        write = f.write
+        for record in metrics:
+            write(_encode_json(record))
+            write(b'\n')
+
 
 class Simulation:
     """
@@ -23,7 +97,8 @@ class Simulation:
     running the simulation through time periods, and generating reports.
     """
     
-    def __init__(self, start_date, end_date, time_interval='MONTHLY', config_directory='config'):
+    def __init__(self, start_date, end_date, time_interval='MONTHLY', config_directory='config',
+                 max_workers=None):
         """
         Initialize simulation with time boundaries and interval.
         
@@ -32,17 +107,24 @@ class Simulation:
             end_date (datetime.date or str): Ending date for the simulation.
             time_interval (str): Time interval for progression ('MONTHLY', 'QUARTERLY', 'ANNUAL').
             config_directory (str): Path to the configuration directory.
+            max_workers (int, optional): Number of threads used to process regions
+                in parallel during a run. If None or 1, regions are processed serially.
         """
         # Convert string dates to datetime objects if needed
         if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+            start_date = datetime.date.fromisoformat(start_date)
             
         if isinstance(end_date, str):
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+            end_date = datetime.date.fromisoformat(end_date)
             
         self.start_date = start_date
         self.end_date = end_date
         self.time_interval = time_interval
+        self.max_workers = max_workers
+        
+        # ISO date strings reported with every set of results
+        self._start_iso = start_date.isoformat()
+        self._end_iso = end_date.isoformat()
         
         # Initialize components
         self.config_manager = ConfigurationManager(config_directory)
@@ -50,6 +132,21 @@ class Simulation:
         self.regions = []
         self.statistics_tracker = StatisticsTracker()
         
+        # Flow definitions are fixed for a run; resolved once at initialization
+        self._flow_definitions = None
+        
+        # Labels for the state history recorded by each region
+        self._history_segments = []
+        self._history_state_ids = []
+        self._history_periods = []
+        self._history_dirty = True  # Whether populations changed since the last snapshot
+        
+        # Thread pool for region processing, open only while a run is in progress
+        self._executor = None
+        
+        # Results dictionary, rebuilt after anything that changes the results
+        self._results_cache = None
+        
         logger.info(f"Initialized simulation from {start_date} to {end_date} "
                    f"with {time_interval} intervals")
     
@@ -60,8 +157,12 @@ class Simulation:
         Returns:
             bool: True if initialization was successful, False otherwise.
         """
+        # Read all setup sections from the merged configuration in one pass
+        sim_params, region_defs, segment_defs, state_defs = (
+            self.config_manager.get_setup_sections()
+        )
+        
         # Initialize time manager
-        sim_params = self.config_manager.get_simulation_parameters()
         fiscal_year_start_month = sim_params.get('fiscal_year_start_month', 4)
         fiscal_year_start_day = sim_params.get('fiscal_year_start_day', 1)
         
@@ -69,27 +170,36 @@ class Simulation:
             start_date=self.start_date,
             time_interval=self.time_interval,
             fiscal_year_start_month=fiscal_year_start_month,
-            fiscal_year_start_day=fiscal_year_start_day
+            fiscal_year_start_day=fiscal_year_start_day,
+            end_date=self.end_date
         )
         
         # Initialize regions and population segments
-        self._initialize_regions()
+        self._initialize_regions(region_defs, segment_defs, state_defs)
+        
+        # Snapshot flow definitions so the per-period loop need not re-query them
+        self._flow_definitions = self.config_manager.get_flow_definitions()
+        
+        # Fix the segment and state order used for state history arrays
+        self._history_segments = [segment for region in self.regions
+                                  for segment in region.population_segments]
+        self._history_state_ids = [state_def['id'] for state_def in state_defs.values()]
         
         logger.info("Simulation initialization complete")
         return True
     
-    def _initialize_regions(self):
+    def _initialize_regions(self, region_defs, segment_defs, state_defs):
         """
         Initialize regions and their population segments.
         
+        Args:
+            region_defs (list): List of region definitions.
+            segment_defs (list): List of population segment definitions.
+            state_defs (dict): Dictionary of state definitions.
+        
         Returns:
             list: List of initialized regions.
         """
-        # Get region and segment definitions from configuration
-        region_defs = self.config_manager.get_regions()
-        segment_defs = self.config_manager.get_population_segments()
-        state_defs = self.config_manager.get_state_definitions()
-        
         # Create regions
         for region_def in region_defs:
             region = Region(
@@ -119,6 +229,7 @@ class Simulation:
             bool: True if loading was successful, False otherwise.
         """
         success = self.config_manager.load_scenario_configuration(scenario_name)
+        self._results_cache = None
         
         if success:
             logger.info(f"Loaded scenario configuration: {scenario_name}")
@@ -135,102 +246,157 @@ class Simulation:
             dict: Dictionary of simulation results.
         """
         logger.info("Starting simulation run")
-        
-        # Capture initial state metrics
-        self.statistics_tracker.update_state_metrics(self.regions, self.time_manager)
-        
-        # Process time periods
-        while self.time_manager.current_date <= self.end_date:
-            period = self.time_manager.get_current_period()
-            logger.info(f"Processing period: {period}")
-            
-            # Process the current time period
-            self.process_time_period()
-            
-            # Record state history for all regions
-            for region in self.regions:
-                region.record_state_history(period)
-            
-            # Calculate derived metrics
-            self.statistics_tracker.calculate_derived_metrics(self.time_manager)
-            
-            # Advance time and check for fiscal year transition
-            fiscal_transition = self.time_manager.advance_time()
-            
-            # Handle fiscal year transition if occurred
-            if fiscal_transition:
-                logger.info(f"Fiscal year transition at {self.time_manager.current_date}")
+        self._results_cache = None
+        
+        # Regions are independent within a period, so they can run in parallel
+        if self.max_workers and self.max_workers > 1 and len(self.regions) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        try:
+            # Process time periods, comparing dates as integer ordinals
+            end_ordinal = self.end_date.toordinal()
+            while self.time_manager.current_ordinal <= end_ordinal:
+                period = self.time_manager.get_current_period()
+                logger.info("Processing period: %s", period)
                 
-                # Reset annual states for all regions
-                for region in self.regions:
-                    reset_results = region.reset_annual_states()
-                    if reset_results:
-                        logger.debug(f"Reset annual states for region {region.region_id}")
-            
-            # Stop if we've reached the end date
-            if self.time_manager.current_date > self.end_date:
-                break
+                # Process the current time period
+                self.process_time_period(period, collect_results=False)
+                
+                # Record state history for all segments
+                self._record_state_history(period)
+                
+                # Calculate derived metrics
+                self.statistics_tracker.calculate_derived_metrics(self.time_manager)
+                
+                # Advance time and check for fiscal year transition
+                fiscal_transition = self.time_manager.advance_time()
+                
+                # Handle fiscal year transition if occurred
+                if fiscal_transition:
+                    logger.info("Fiscal year transition at %s", self.time_manager.current_date)
+                    
+                    # Reset annual states for all regions
+                    for region in self.regions:
+                        reset_results = region.reset_annual_states()
+                        if reset_results:
+                            self._history_dirty = True
+                            logger.debug("Reset annual states for region %s", region.region_id)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
         
         logger.info("Simulation run complete")
         
         # Return simulation results
         return self.get_simulation_results()
     
-    def process_time_period(self):
+    def _record_state_history(self, period):
+        """
+        Record a snapshot of all segment state populations for a period.
+        
+        Each region stores a copy of its populations array. If no flow or reset
+        has changed any population since the previous snapshot, regions share
+        their previous snapshot rather than copying again.
+        
+        Args:
+            period (str): Identifier for the time period.
+        """
+        reuse_previous = not self._history_dirty and bool(self._history_periods)
+        for region in self.regions:
+            region.record_state_history(period, reuse_previous)
+        
+        self._history_dirty = False
+        self._history_periods.append(period)
+    
+    def get_state_history(self):
+        """
+        Get recorded state populations for all periods.
+        
+        The snapshots recorded by each region are joined along the segment
+        axis, in region order.
+        
+        Returns:
+            dict: Dictionary with 'periods', 'segments' and 'states' labels and a
+                'values' array of shape (periods, segments, states).
+        """
+        region_values = [region.get_state_history()['values'] for region in self.regions
+                         if region.population_segments]
+        if region_values:
+            values = np.concatenate(region_values, axis=1)
+        else:
+            values = np.zeros((len(self._history_periods), 0, len(self._history_state_ids)),
+                              dtype=np.int64)
+        
+        return {
+            'periods': list(self._history_periods),
+            'segments': [segment.segment_id for segment in self._history_segments],
+            'states': list(self._history_state_ids),
+            'values': values
+        }
+    
+    def process_time_period(self, period=None, collect_results=True):
         """
         Process a single time period for all regions.
         
+        Args:
+            period (str, optional): Identifier for the current period. If None,
+                it is taken from the time manager.
+            collect_results (bool): If False, flows are only counted for the
+                statistics and no ProcessResult objects are built or returned.
+        
         Returns:
-            dict: Dictionary of process results.
+            dict: Dictionary of process results (empty if collect_results is False).
         """
+        if period is None:
+            period = self.time_manager.get_current_period()
+        
+        self._results_cache = None
         all_results = []
         
-        # Process population flows for all regions
-        for region in self.regions:
-            flow_results = region.process_population_flows(
-                self.time_manager, self.config_manager
+        # Process population flows for all regions, keeping results in region order
+        if self._executor is not None:
+            region_results = self._executor.map(
+                lambda region: region.process_population_flows(
+                    self.time_manager, self.config_manager, self._flow_definitions,
+                    collect_results
+                ),
+                self.regions
             )
-            
+        else:
+            region_results = (
+                region.process_population_flows(
+                    self.time_manager, self.config_manager, self._flow_definitions,
+                    collect_results
+                )
+                for region in self.regions
+            )
+        
+        for flow_results in region_results:
             all_results.extend(flow_results)
         
+        if all_results:
+            self._history_dirty = True
+        
         # Update state metrics after all flows
         self.statistics_tracker.update_state_metrics(self.regions, self.time_manager)
         
-        # Update flow metrics from results
-        period = self.time_manager.get_current_period()
-        for result in all_results:
-            if hasattr(result, 'flow_id') and result.flow_id:
-                self.statistics_tracker.update_flow_metric(
-                    flow_id=result.flow_id, 
-                    period=period, 
-                    count=result.success_count, 
-                    segment_id=result.segment_id
-                )
+        # Aggregate flow and financial results, then record them in bulk
+        if collect_results:
+            ProcessResult.add_many_to_statistics(
+                all_results, self.statistics_tracker, self.time_manager, period
+            )
+        else:
+            # Regions returned (flow_id, segment_id, region_id, cohort_type,
+            # age_bracket, success_count) tuples
+            flow_counts = defaultdict(int)
+            for *key, success_count in all_results:
+                flow_counts[tuple(key)] += success_count
+            all_results = []
             
-            # Add financial impact if present
-            if hasattr(result, 'financial_impact') and result.financial_impact > 0:
-                self.statistics_tracker.update_financial_metric(
-                    metric_id='claim_expenditure',
-                    period=period, 
-                    amount=result.financial_impact, 
-                    segment_id=result.segment_id
-                )
-                
-                if hasattr(result, 'program_payment') and result.program_payment > 0:
-                    self.statistics_tracker.update_financial_metric(
-                        metric_id='program_expenditure',
-                        period=period, 
-                        amount=result.program_payment, 
-                        segment_id=result.segment_id
-                    )
-                
-                if hasattr(result, 'patient_payment') and result.patient_payment > 0:
-                    self.statistics_tracker.update_financial_metric(
-                        metric_id='patient_expenditure',
-                        period=period, 
-                        amount=result.patient_payment, 
-                        segment_id=result.segment_id
-                    )
+            self.statistics_tracker.update_flow_metrics_bulk(
+                period, [key + (count,) for key, count in flow_counts.items()]
+            )
         
         return {'period': period, 'results': all_results}
     
@@ -238,17 +404,24 @@ class Simulation:
         """
         Get the complete simulation results.
         
+        The results are built once and returned again on later calls until the
+        simulation processes another period or loads a new scenario. Callers
+        should treat the returned dictionary as read-only.
+        
         Returns:
             dict: Dictionary of simulation results in normalized format.
         """
+        if self._results_cache is not None:
+            return self._results_cache
+        
         # Get normalized metrics from the statistics tracker
         metrics_dict = self.statistics_tracker.export_to_dict()
         
         # Add simulation parameters
         results = {
             'simulation_params': {
-                'start_date': self.start_date.isoformat(),
-                'end_date': self.end_date.isoformat(),
+                'start_date': self._start_iso,
+                'end_date': self._end_iso,
                 'time_interval': self.time_interval,
                 'scenario': self.config_manager.scenario_name
             }
@@ -257,6 +430,7 @@ class Simulation:
         # Merge with metrics
         results.update(metrics_dict)
         
+        self._results_cache = results
         return results
     
     def generate_reports(self):
@@ -277,8 +451,9 @@ class Simulation:
         
         Args:
             output_path (str): Base path for output files (without extension).
-            formats (list, optional): List of format strings ('json', 'csv'). 
-                                      If None, exports to JSON only.
+            formats (list, optional): List of format strings ('json', 'ndjson', 'csv').
+                                      If None, exports to JSON only. NDJSON output
+                                      holds the metric records only.
             
         Returns:
             dict: Dictionary mapping formats to file paths.
@@ -292,11 +467,15 @@ class Simulation:
         # Export to JSON
         if 'json' in formats:
             json_path = f"{output_path}.json"
-            import json
-            with open(json_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            _write_results_json(results, json_path)
             file_paths['json'] = json_path
         
+        # Export metrics as newline-delimited JSON
+        if 'ndjson' in formats:
+            ndjson_path = f"{output_path}.ndjson"
+            _write_metrics_ndjson(results['metrics'], ndjson_path)
+            file_paths['ndjson'] = ndjson_path
+        
         # Export to CSV
         if 'csv' in formats:
             csv_paths = self.statistics_tracker.export_to_csv(output_path)
@@ -304,13 +483,10 @@ class Simulation:
             
             # Also export simulation parameters
             params_path = f"{output_path}_simulation_params.csv"
-            param_rows = []
-            for key, value in results['simulation_params'].items():
-                param_rows.append(f"{key},{value}")
-            
-            with open(params_path, 'w') as f:
-                f.write("parameter,value\n")
-                f.write("\n".join(param_rows))
+            with open(params_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['parameter', 'value'])
+                writer.writerows(results['simulation_params'].items())
             
             file_paths['csv']['params'] = params_path
         
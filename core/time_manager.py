@@ -5,8 +5,8 @@ This module provides the TimeManager class, which manages time progression durin
 the simulation and provides utilities for date-related calculations.
 """
 
+import calendar
 import datetime
-from dateutil.relativedelta import relativedelta
 from enum import Enum, auto
 
 
@@ -17,6 +17,33 @@ class TimeInterval(Enum):
     ANNUAL = auto()
 
 
+# Number of calendar months each interval advances by
+_INTERVAL_MONTHS = {
+    TimeInterval.MONTHLY: 1,
+    TimeInterval.QUARTERLY: 3,
+    TimeInterval.ANNUAL: 12
+}
+
+
+def _add_months(date, months):
+    """
+    Add calendar months to a date, clamping the day to the end of the month.
+    
+    Matches ``date + relativedelta(months=months)`` using integer arithmetic.
+    
+    Args:
+        date (datetime.date): Date to advance.
+        months (int): Number of months to add.
+        
+    Returns:
+        datetime.date: The advanced date.
+    """
+    year, month = divmod(date.year * 12 + date.month - 1 + months, 12)
+    month += 1
+    day = min(date.day, calendar.monthrange(year, month)[1])
+    return datetime.date(year, month, day)
+
+
 class TimeManager:
     """
     Manages time progression during simulation.
@@ -26,7 +53,7 @@ class TimeManager:
     """
     
     def __init__(self, start_date, time_interval=TimeInterval.MONTHLY, 
-                 fiscal_year_start_month=4, fiscal_year_start_day=1):
+                 fiscal_year_start_month=4, fiscal_year_start_day=1, end_date=None):
         """
         Initialize with start date and time interval.
         
@@ -35,10 +62,12 @@ class TimeManager:
             time_interval (TimeInterval): The interval for time progression.
             fiscal_year_start_month (int): Month when fiscal year starts (1-12).
             fiscal_year_start_day (int): Day when fiscal year starts (1-31).
+            end_date (datetime.date, optional): Last date of the simulation. If
+                given, period strings for every step are computed up front.
         """
         if isinstance(start_date, str):
             # Convert string date to datetime.date
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+            start_date = datetime.date.fromisoformat(start_date)
             
         self.start_date = start_date
         self.current_date = start_date
@@ -46,12 +75,34 @@ class TimeManager:
         if isinstance(time_interval, str):
             time_interval = TimeInterval[time_interval.upper()]
         self.time_interval = time_interval
+        self._interval_months = _INTERVAL_MONTHS[time_interval]
         
         self.fiscal_year_start_month = fiscal_year_start_month
         self.fiscal_year_start_day = fiscal_year_start_day
         
         # Calculate the first fiscal year start date on or before the start date
         self._calculate_fiscal_year_start()
+        
+        # Maps step dates to period strings
+        self._period_cache = {}
+        if end_date is not None:
+            if isinstance(end_date, str):
+                end_date = datetime.date.fromisoformat(end_date)
+            step_date = start_date
+            while step_date <= end_date:
+                self._period_cache[step_date] = self._format_period(step_date)
+                step_date = _add_months(step_date, self._interval_months)
+    
+    @property
+    def current_date(self):
+        """datetime.date: Current date in the simulation."""
+        return self._current_date
+    
+    @current_date.setter
+    def current_date(self, value):
+        """Set the current date and its cached ordinal."""
+        self._current_date = value
+        self.current_ordinal = value.toordinal()
     
     def _calculate_fiscal_year_start(self):
         """Calculate the fiscal year start date for the current date."""
@@ -66,6 +117,16 @@ class TimeManager:
                                          self.fiscal_year_start_day)
         
         self.fiscal_year_start_date = fiscal_start
+        self._set_next_fiscal_start()
+    
+    def _set_next_fiscal_start(self):
+        """Cache the next fiscal year start date and its ordinal."""
+        self._next_fiscal_start = datetime.date(
+            self.fiscal_year_start_date.year + 1,
+            self.fiscal_year_start_month,
+            self.fiscal_year_start_day
+        )
+        self._next_fiscal_ordinal = self._next_fiscal_start.toordinal()
     
     def advance_time(self):
         """
@@ -74,22 +135,12 @@ class TimeManager:
         Returns:
             datetime.date: The new current date after advancing.
         """
-        if self.time_interval == TimeInterval.MONTHLY:
-            self.current_date = self.current_date + relativedelta(months=1)
-        elif self.time_interval == TimeInterval.QUARTERLY:
-            self.current_date = self.current_date + relativedelta(months=3)
-        elif self.time_interval == TimeInterval.ANNUAL:
-            self.current_date = self.current_date + relativedelta(years=1)
+        self.current_date = _add_months(self.current_date, self._interval_months)
         
         # Check if we've crossed into a new fiscal year
-        next_fiscal_start = datetime.date(
-            self.fiscal_year_start_date.year + 1,
-            self.fiscal_year_start_month,
-            self.fiscal_year_start_day
-        )
-        
-        if self.current_date >= next_fiscal_start:
-            self.fiscal_year_start_date = next_fiscal_start
+        if self.current_ordinal >= self._next_fiscal_ordinal:
+            self.fiscal_year_start_date = self._next_fiscal_start
+            self._set_next_fiscal_start()
             return True  # Indicate fiscal year transition
         
         return False  # No fiscal year transition
@@ -104,20 +155,36 @@ class TimeManager:
         return (self.current_date.month == self.fiscal_year_start_month and
                 self.current_date.day == self.fiscal_year_start_day)
     
-    def get_current_period(self):
+    def _format_period(self, date):
         """
-        Get string representation of current period.
+        Format the period containing a date for the current time interval.
         
+        Args:
+            date (datetime.date): Date within the period.
+            
         Returns:
-            str: A string representing the current period (e.g., "2025-04").
+            str: Period identifier (e.g., "2025-04", "2025-Q2" or "2025").
         """
         if self.time_interval == TimeInterval.MONTHLY:
-            return self.current_date.strftime("%Y-%m")
+            return f"{date.year:04d}-{date.month:02d}"
         elif self.time_interval == TimeInterval.QUARTERLY:
-            quarter = (self.current_date.month - 1) // 3 + 1
-            return f"{self.current_date.year}-Q{quarter}"
+            quarter = (date.month - 1) // 3 + 1
+            return f"{date.year}-Q{quarter}"
         elif self.time_interval == TimeInterval.ANNUAL:
-            return str(self.current_date.year)
+            return str(date.year)
+    
+    def get_current_period(self):
+        """
+        Get string representation of current period.
+        
+        Returns:
+            str: A string representing the current period (e.g., "2025-04").
+        """
+        period = self._period_cache.get(self.current_date)
+        if period is None:
+            period = self._format_period(self.current_date)
+            self._period_cache[self.current_date] = period
+        return period
     
     def get_months_since(self, reference_date):
         """
@@ -130,10 +197,20 @@ class TimeManager:
             int: Number of months between the reference and current date.
         """
         if isinstance(reference_date, str):
-            reference_date = datetime.datetime.strptime(reference_date, "%Y-%m-%d").date()
+            reference_date = datetime.date.fromisoformat(reference_date)
             
-        delta = relativedelta(self.current_date, reference_date)
-        return delta.years * 12 + delta.months
+        months = ((self.current_date.year - reference_date.year) * 12 +
+                  self.current_date.month - reference_date.month)
+        
+        # Count only whole months, as relativedelta(current_date, reference_date) does
+        if months > 0:
+            while months > 0 and _add_months(reference_date, months) > self.current_date:
+                months -= 1
+        elif months < 0:
+            while months < 0 and _add_months(reference_date, months) < self.current_date:
+                months += 1
+        
+        return months
     
     def get_current_fiscal_year(self):
         """
@@ -6,11 +6,17 @@ This module provides the entry point for running simulations.
 
 import os
 import sys
+import json
 import logging
 import argparse
 import datetime
-import json
-from core.simulation import Simulation
+from operator import itemgetter
+from types import SimpleNamespace
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +29,24 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Default values for command line arguments, shared with --json-args
+DEFAULT_ARGUMENTS = {
+    'start_date': '2025-04-01',
+    'end_date': '2026-03-31',
+    'time_interval': 'MONTHLY',
+    'config_dir': 'config',
+    'scenario': 'simple_scenario',
+    'output_dir': 'output',
+    'output_format': 'json',
+    'workers': None,
+    'list_scenarios': False,
+    'verbose': False
+}
+
+# Allowed values for the options argparse restricts, shared with --json-args
+TIME_INTERVAL_CHOICES = ['MONTHLY', 'QUARTERLY', 'ANNUAL']
+OUTPUT_FORMAT_CHOICES = ['json', 'ndjson', 'csv', 'both']
+
 
 def parse_arguments():
     """
@@ -31,30 +55,38 @@ def parse_arguments():
     Returns:
         argparse.Namespace: Parsed command line arguments.
     """
-    parser = argparse.ArgumentParser(description='Run OHB Simulation Model')
+    parser = argparse.ArgumentParser(
+        description='Run OHB Simulation Model',
+        epilog='Batch runs may instead pass "--json-args PATH" as the only argument '
+               'to load all options from a JSON file.'
+    )
     
-    parser.add_argument('--start-date', type=str, default='2025-04-01',
+    parser.add_argument('--start-date', type=str, default=DEFAULT_ARGUMENTS['start_date'],
                        help='Start date for simulation (YYYY-MM-DD)')
     
-    parser.add_argument('--end-date', type=str, default='2026-03-31',
+    parser.add_argument('--end-date', type=str, default=DEFAULT_ARGUMENTS['end_date'],
                        help='End date for simulation (YYYY-MM-DD)')
     
-    parser.add_argument('--time-interval', type=str, default='MONTHLY',
-                       choices=['MONTHLY', 'QUARTERLY', 'ANNUAL'],
+    parser.add_argument('--time-interval', type=str, default=DEFAULT_ARGUMENTS['time_interval'],
+                       choices=TIME_INTERVAL_CHOICES,
                        help='Time interval for simulation progression')
     
-    parser.add_argument('--config-dir', type=str, default='config',
+    parser.add_argument('--config-dir', type=str, default=DEFAULT_ARGUMENTS['config_dir'],
                        help='Directory containing configuration files')
     
-    parser.add_argument('--scenario', type=str, default='simple_scenario',
+    parser.add_argument('--scenario', type=str, default=DEFAULT_ARGUMENTS['scenario'],
                        help='Name of the scenario to run')
     
-    parser.add_argument('--output-dir', type=str, default='output',
+    parser.add_argument('--output-dir', type=str, default=DEFAULT_ARGUMENTS['output_dir'],
                        help='Directory for output files')
     
-    parser.add_argument('--output-format', type=str, default='json',
-                       choices=['json', 'csv', 'both'],
-                       help='Format for output files (json, csv, or both)')
+    parser.add_argument('--output-format', type=str, default=DEFAULT_ARGUMENTS['output_format'],
+                       choices=OUTPUT_FORMAT_CHOICES,
+                       help='Format for output files (json, ndjson, csv, or both '
+                            'for json and csv)')
+    
+    parser.add_argument('--workers', type=int, default=DEFAULT_ARGUMENTS['workers'],
+                       help='Number of threads used to process regions in parallel')
     
     parser.add_argument('--list-scenarios', action='store_true',
                        help='List available scenarios and exit')
@@ -65,6 +97,49 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def load_json_arguments(path):
+    """
+    Load command line arguments from a JSON file, skipping argparse.
+    
+    Used by batch scenario sweeps that start many runs with precomputed
+    arguments. Options missing from the file take their default values.
+    
+    Args:
+        path (str): Path to a JSON object keyed by argument name
+            (e.g. 'scenario', 'output_dir').
+        
+    Returns:
+        types.SimpleNamespace: Arguments with the same attributes as
+            parse_arguments() returns.
+            
+    Raises:
+        ValueError: If the file has unknown argument names, or a time_interval
+            or output_format that the command line would reject.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    values = orjson.loads(data) if orjson is not None else json.loads(data)
+    
+    if not isinstance(values, dict):
+        raise ValueError(f"{path} must contain a JSON object of arguments")
+    
+    unknown = sorted(set(values) - set(DEFAULT_ARGUMENTS))
+    if unknown:
+        raise ValueError(f"Unknown arguments in {path}: {', '.join(unknown)}")
+    
+    args = SimpleNamespace(**{**DEFAULT_ARGUMENTS, **values})
+    
+    # Apply the same choices argparse enforces on the command line
+    if args.time_interval not in TIME_INTERVAL_CHOICES:
+        raise ValueError(f"Invalid time_interval {args.time_interval!r} in {path}; "
+                         f"choose from {', '.join(TIME_INTERVAL_CHOICES)}")
+    if args.output_format not in OUTPUT_FORMAT_CHOICES:
+        raise ValueError(f"Invalid output_format {args.output_format!r} in {path}; "
+                         f"choose from {', '.join(OUTPUT_FORMAT_CHOICES)}")
+    
+    return args
+
+
 def list_available_scenarios(config_dir):
     """
     List available simulation scenarios.
@@ -83,13 +158,58 @@ def list_available_scenarios(config_dir):
     if scenarios:
         print("Available scenarios:")
         for scenario in scenarios:
-            print(f"  - {scenario}")
+            description = config_manager.peek_scenario_metadata(scenario).get('description')
+            if description:
+                print(f"  - {scenario}: {description}")
+            else:
+                print(f"  - {scenario}")
     else:
         print("No scenarios found in", config_dir)
     
     return scenarios
 
 
+def summarize_metrics(metrics):
+    """
+    Collect the summary figures reported at the end of a run in one pass.
+    
+    Args:
+        metrics (list): Normalized metric records from the simulation results.
+        
+    Returns:
+        dict: Dictionary with 'final_period' (None if no dated periods), the
+            overall 'total_eligible', 'total_enrolled' and 'enrollment_rate' for
+            that period, and 'total_expenditure' across all periods.
+    """
+    final_period = None
+    derived_values = {}  # Maps (metric_id, period) to the first overall value
+    total_expenditure = 0
+    
+    # Read all fields of each metric with a single call
+    fields = itemgetter("type", "id", "period", "region", "cohort", "age_bracket", "value")
+    
+    for metric_type, metric_id, period, region, cohort, age_bracket, value in map(fields, metrics):
+        if period[:2] == "20" and (final_period is None or period > final_period):
+            final_period = period
+        
+        # Only overall figures are summarized
+        if region != "ALL" or cohort != "ALL" or age_bracket != "ALL":
+            continue
+        
+        if metric_type == "derived":
+            derived_values.setdefault((metric_id, period), value)
+        elif metric_type == "financial" and metric_id == "claim_expenditure":
+            total_expenditure += value
+    
+    return {
+        "final_period": final_period,
+        "total_eligible": derived_values.get(("total_eligible_population", final_period), 0),
+        "total_enrolled": derived_values.get(("total_enrolled_population", final_period), 0),
+        "enrollment_rate": derived_values.get(("enrollment_rate", final_period), 0),
+        "total_expenditure": total_expenditure
+    }
+
+
 def main():
     """
     Main application entry point.
@@ -97,8 +217,16 @@ def main():
     Returns:
         int: Exit code (0 for success, non-zero for failure).
     """
-    # Parse command line arguments
-    args = parse_arguments()
+    # Parse command line arguments, or load them directly for batch runs
+    if len(sys.argv) == 3 and sys.argv[1] == '--json-args':
+        try:
+            args = load_json_arguments(sys.argv[2])
+        except ValueError as e:
+            # Exit with the same status argparse uses for invalid arguments
+            logger.error(str(e))
+            return 2
+    else:
+        args = parse_arguments()
     
     # Set logging level based on verbose flag
     if args.verbose:
@@ -114,13 +242,17 @@ def main():
         os.makedirs(args.output_dir)
         logger.info(f"Created output directory: {args.output_dir}")
     
+    # Imported here so listing scenarios does not load NumPy and the simulation stack
+    from core.simulation import Simulation
+    
     try:
         # Create and initialize simulation
         simulation = Simulation(
             start_date=args.start_date,
             end_date=args.end_date,
             time_interval=args.time_interval,
-            config_directory=args.config_dir
+            config_directory=args.config_dir,
+            max_workers=args.workers
         )
         
         # Load scenario configuration
@@ -146,6 +278,8 @@ def main():
         formats = []
         if args.output_format == 'json' or args.output_format == 'both':
             formats.append('json')
+        if args.output_format == 'ndjson':
+            formats.append('ndjson')
         if args.output_format == 'csv' or args.output_format == 'both':
             formats.append('csv')
         
@@ -168,43 +302,12 @@ def main():
         print(f"  Time period: {args.start_date} to {args.end_date}")
         print(f"  Time interval: {args.time_interval}")
         
-        # Find the latest period in the metrics
-        all_periods = set(m["period"] for m in results["metrics"] if m["period"].startswith("20"))
-        if all_periods:
-            final_period = max(all_periods)
-            
-            # Get total eligible population
-            total_eligible_metrics = [m for m in results["metrics"] 
-                                      if m["type"] == "derived" and 
-                                         m["id"] == "total_eligible_population" and 
-                                         m["period"] == final_period and
-                                         m["region"] == "ALL" and
-                                         m["cohort"] == "ALL" and
-                                         m["age_bracket"] == "ALL"]
-            
-            total_eligible = total_eligible_metrics[0]["value"] if total_eligible_metrics else 0
-            
-            # Get total enrolled population
-            total_enrolled_metrics = [m for m in results["metrics"] 
-                                      if m["type"] == "derived" and 
-                                         m["id"] == "total_enrolled_population" and 
-                                         m["period"] == final_period and
-                                         m["region"] == "ALL" and
-                                         m["cohort"] == "ALL" and
-                                         m["age_bracket"] == "ALL"]
-            
-            total_enrolled = total_enrolled_metrics[0]["value"] if total_enrolled_metrics else 0
-            
-            # Get enrollment rate
-            enrollment_rate_metrics = [m for m in results["metrics"] 
-                                      if m["type"] == "derived" and 
-                                         m["id"] == "enrollment_rate" and 
-                                         m["period"] == final_period and
-                                         m["region"] == "ALL" and
-                                         m["cohort"] == "ALL" and
-                                         m["age_bracket"] == "ALL"]
-            
-            enrollment_rate = enrollment_rate_metrics[0]["value"] if enrollment_rate_metrics else 0
+        summary = summarize_metrics(results["metrics"])
+        final_period = summary["final_period"]
+        if final_period:
+            total_eligible = summary["total_eligible"]
+            total_enrolled = summary["total_enrolled"]
+            enrollment_rate = summary["enrollment_rate"]
             
             print(f"\nFinal Enrollment Metrics (Period {final_period}):")
             print(f"  Total Eligible Population: {total_eligible:,}")
@@ -212,14 +315,7 @@ def main():
             print(f"  Enrollment Rate: {enrollment_rate:.2%}")
             
             # Calculate financial metrics
-            expenditure_metrics = [m for m in results["metrics"] 
-                                  if m["type"] == "financial" and 
-                                     m["id"] == "claim_expenditure" and
-                                     m["region"] == "ALL" and
-                                     m["cohort"] == "ALL" and
-                                     m["age_bracket"] == "ALL"]
-            
-            total_expenditure = sum(m["value"] for m in expenditure_metrics)
+            total_expenditure = summary["total_expenditure"]
             
             if total_expenditure > 0:
                 print("\nFinancial Metrics:")
@@ -7,10 +7,95 @@ flow of population between states.
 
 import logging
 import random
+import numpy as np
 from process.process_result import ProcessResult
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Simple seasonal adjustment - higher rates in Q1 and Q3
+SEASONAL_MONTHS = frozenset([1, 2, 3, 7, 8, 9])
+SEASONAL_FACTOR = 1.1
+
+# Seasonal rate multiplier indexed by calendar month (index 0 is unused)
+SEASONAL_MULTIPLIERS = tuple(
+    SEASONAL_FACTOR if month in SEASONAL_MONTHS else 1.0 for month in range(13)
+)
+
+
+def _apply_flows_loop(populations, source_idx, target_idx, rates, moved, available):
+    """
+    Apply flows one segment and flow at a time.
+    
+    Compiled with Numba when it is installed, releasing the GIL so regions can
+    be processed on parallel threads; see apply_flows for arguments.
+    """
+    n_segments, n_flows = rates.shape
+    for i in range(n_segments):
+        for f in range(n_flows):
+            source = populations[i, source_idx[f]]
+            # Clamp to the available source population. Each flow reads the row the
+            # previous flow just updated, so this loop runs sequentially.
+            amount = max(min(int(source * rates[i, f]), source), 0)
+            populations[i, source_idx[f]] -= amount
+            populations[i, target_idx[f]] += amount
+            moved[i, f] = amount
+            available[i, f] = source
+
+
+if njit is not None:
+    _apply_flows_jit = njit(cache=True, nogil=True)(_apply_flows_loop)
+else:
+    _apply_flows_jit = None
+
+
+def apply_flows(populations, source_idx, target_idx, rates):
+    """
+    Apply a sequence of flows to all segments at once.
+    
+    Flows are applied in order, so each flow sees the populations left by the
+    flows before it, exactly as applying every flow to one segment at a time.
+    Uses a Numba-compiled loop when Numba is available, and NumPy column
+    operations otherwise.
+    
+    Args:
+        populations (numpy.ndarray): Integer array of shape (segments, states),
+            updated in place.
+        source_idx (sequence): Source state column for each flow.
+        target_idx (sequence): Target state column for each flow.
+        rates (numpy.ndarray): Flow rates of shape (segments, flows).
+        
+    Returns:
+        tuple: (moved, available) integer arrays of shape (segments, flows) with
+            the population moved by each flow and the source population it
+            was drawn from.
+    """
+    n_segments, n_flows = rates.shape
+    moved = np.zeros((n_segments, n_flows), dtype=np.int64)
+    available = np.zeros((n_segments, n_flows), dtype=np.int64)
+    
+    if _apply_flows_jit is not None:
+        _apply_flows_jit(populations, np.asarray(source_idx, dtype=np.int64),
+                         np.asarray(target_idx, dtype=np.int64), rates, moved, available)
+        return moved, available
+    
+    for f in range(n_flows):
+        source = populations[:, source_idx[f]].copy()
+        
+        # Truncate toward zero like int(), limited to the available population
+        amount = np.clip((source * rates[:, f]).astype(np.int64), 0, source)
+        
+        populations[:, source_idx[f]] -= amount
+        populations[:, target_idx[f]] += amount
+        moved[:, f] = amount
+        available[:, f] = source
+    
+    return moved, available
+
 
 class PopulationFlow:
     """
@@ -67,7 +152,7 @@ class PopulationFlow:
         flow_amount = int(population_size * rate)
         return flow_amount
     
-    def apply_flow(self, population_segment, config_manager, time_manager):
+    def apply_flow(self, population_segment, config_manager, time_manager, collect_results=True):
         """
         Apply calculated flow to population segment.
         
@@ -75,9 +160,12 @@ class PopulationFlow:
             population_segment (PopulationSegment): Target population segment.
             config_manager (ConfigurationManager): Configuration manager.
             time_manager (TimeManager): Time manager.
+            collect_results (bool): If False, return the success count instead
+                of building a ProcessResult.
             
         Returns:
-            ProcessResult: Result of the flow application.
+            ProcessResult: Result of the flow application, or int success count
+                if collect_results is False.
         """
         # Get source population
         source_population = population_segment.get_state_population(self.source_state)
@@ -101,6 +189,9 @@ class PopulationFlow:
         if success_count <= 0:
             return None  # No successful transitions
         
+        if not collect_results:
+            return success_count
+        
         # Create process result with segment information
         region_id = population_segment.region_id
         cohort_type = population_segment.cohort_type
@@ -144,13 +235,9 @@ class PopulationFlow:
         
         # In Phase 1, implement a simple time-based adjustment
         # Later phases can implement more sophisticated adjustments
-        month = time_manager.current_date.month
-        
-        # Simple seasonal adjustment - higher rates in Q1 and Q3
-        if month in [1, 2, 3, 7, 8, 9]:
-            rate = rate * 1.1
+        rate *= SEASONAL_MULTIPLIERS[time_manager.current_date.month]
         
-        return min(1.0, rate)
+        return rate if rate < 1.0 else 1.0
     
     def __str__(self):
         """Return string representation of the PopulationFlow."""
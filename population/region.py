@@ -6,6 +6,7 @@ with population segments.
 """
 
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,93 @@ class Region:
         self.region_id = region_id
         self.region_name = region_name
         self.population_segments = []
+        self._segment_index = {}  # Maps segment_id to the first segment with that id
         self.regional_factors = {}  # For adjustment factors specific to this region
+        
+        # Resolved flows and unadjusted rates, reused while the flow definitions
+        # and configuration are unchanged (see _plan_flows)
+        self._flow_plan = None
+        
+        # State populations of all segments as one (segments, states) array,
+        # built when first needed after segments are added
+        self._populations = None
+        self._state_ids = []
+        self._segment_sizes = None  # Configured segment sizes as an array
+        self._reset_columns = None
+        self._re_enroll_column = None
+        
+        # Copies of the populations array by period_id, in recording order
+        self._state_history = {}
+    
+    @property
+    def populations(self):
+        """numpy.ndarray: Integer state populations of shape (segments, states)."""
+        if self._populations is None:
+            self._bind_populations()
+        return self._populations
+    
+    @property
+    def state_ids(self):
+        """list: State identifiers for the columns of the populations array."""
+        if self._populations is None:
+            self._bind_populations()
+        return self._state_ids
+    
+    def _bind_populations(self):
+        """
+        Move the state populations of all segments into one shared array.
+        
+        Each segment's ProcessState objects are bound to their cells, so they
+        read and write the array directly. Columns follow the order states
+        are first seen in the segments.
+        """
+        state_index = {}
+        for segment in self.population_segments:
+            for state_id in segment.states:
+                state_index.setdefault(state_id, len(state_index))
+        
+        populations = np.zeros((len(self.population_segments), len(state_index)),
+                               dtype=np.int64)
+        for row, segment in enumerate(self.population_segments):
+            for state_id, state in segment.states.items():
+                state.bind(populations, (row, state_index[state_id]), self._state_history)
+        
+        self._state_ids = list(state_index)
+        self._populations = populations
+        self._plan_resets()
+    
+    def _plan_resets(self):
+        """
+        Find the population columns cleared at a fiscal year change.
+        
+        Sets the columns to reset and the re-enrollment column they move to.
+        The columns are left as None, so resets fall back to each segment,
+        unless every segment has every state with the same reset flags and
+        the re-enrollment state is not itself reset.
+        """
+        self._reset_columns = None
+        self._re_enroll_column = None
+        
+        state_ids = self._state_ids
+        flags = None
+        for segment in self.population_segments:
+            if len(segment.states) != len(state_ids):
+                return
+            segment_flags = [segment.states[state_id].should_reset_on_fiscal_year()
+                             for state_id in state_ids]
+            if flags is None:
+                flags = segment_flags
+            elif segment_flags != flags:
+                return
+        
+        reset_columns = [i for i, flag in enumerate(flags or []) if flag]
+        if 're_enrollment_eligible' in state_ids:
+            re_enroll_column = state_ids.index('re_enrollment_eligible')
+            if re_enroll_column in reset_columns:
+                return
+            self._re_enroll_column = re_enroll_column
+        
+        self._reset_columns = reset_columns
     
     def add_population_segment(self, segment):
         """
@@ -50,6 +137,10 @@ class Region:
             segment.region_id = self.region_id
         
         self.population_segments.append(segment)
+        self._segment_index.setdefault(segment.segment_id, segment)
+        self._flow_plan = None
+        self._populations = None
+        self._segment_sizes = None
         return segment
     
     def initialize_segments(self, segment_definitions, state_definitions):
@@ -94,50 +185,131 @@ class Region:
         
         return self.population_segments
     
-    def process_population_flows(self, time_manager, config_manager):
+    def process_population_flows(self, time_manager, config_manager, flow_definitions=None,
+                                 collect_results=True):
         """
         Process all population flows for the current time period.
         
-        In Phase 1, we'll implement a simple flow processing that moves
-        population between states based on flow rates.
+        Each flow moves population between states based on flow rates, and is
+        applied to all segments in the region at once.
         
         Args:
             time_manager (TimeManager): Manager for the current time.
             config_manager (ConfigurationManager): Configuration manager.
+            flow_definitions (dict, optional): Flow definitions to process. If None,
+                they are read from the configuration manager.
+            collect_results (bool): If False, skip building ProcessResult objects
+                and return (flow_id, segment_id, region_id, cohort_type, age_bracket,
+                success_count) tuples instead.
             
         Returns:
-            list: List of process results from flow processing.
+            list: List of process results from flow processing, or of count
+                tuples if collect_results is False.
         """
-        from population.flow import PopulationFlow
+        from population.flow import apply_flows, SEASONAL_MULTIPLIERS
+        from process.process_result import ProcessResult
         
-        flow_definitions = config_manager.get_flow_definitions()
+        if flow_definitions is None:
+            flow_definitions = config_manager.get_flow_definitions()
         flow_results = []
         
-        # Process each flow for each segment
-        for segment in self.population_segments:
-            for flow_id, flow_def in flow_definitions.items():
-                source_id = flow_def.get('source')
-                target_id = flow_def.get('target')
-                
-                # Create flow
-                flow = PopulationFlow(
-                    flow_id=flow_id,
-                    source_state=source_id,
-                    target_state=target_id
-                )
-                
-                # Calculate and apply flow
-                result = flow.apply_flow(
-                    population_segment=segment,
-                    config_manager=config_manager,
-                    time_manager=time_manager
-                )
-                
-                if result and result.success_count > 0:
-                    flow_results.append(result)
+        if not self.population_segments:
+            return flow_results
+        
+        # Resolve flows to population array columns and look up base rates,
+        # reusing the previous plan while flows and configuration are unchanged
+        populations = self.populations
+        merged_config = config_manager.get_merged_config()
+        plan = self._flow_plan
+        if plan is None or plan[0] is not flow_definitions or plan[1] is not merged_config:
+            plan = self._plan_flows(flow_definitions, config_manager, merged_config)
+            self._flow_plan = plan
+        _, _, flows, source_idx, target_idx, rates = plan
+        
+        if not flows:
+            return flow_results
+        
+        seasonal_factor = SEASONAL_MULTIPLIERS[time_manager.current_date.month]
+        if seasonal_factor != 1.0:
+            rates = rates * seasonal_factor
+        rates = np.minimum(rates, 1.0)
+        
+        moved, available = apply_flows(populations, source_idx, target_idx, rates)
+        
+        # Populations were updated in place; report only the (segment, flow)
+        # pairs that moved population, in segment order
+        segment_rows, flow_cols = np.nonzero(moved)
+        segments = self.population_segments
+        
+        if not collect_results:
+            flow_results.extend(
+                (flows[f][0], segments[i].segment_id, self.region_id,
+                 segments[i].cohort_type, segments[i].age_bracket.bracket_name, success_count)
+                for i, f, success_count in zip(segment_rows.tolist(), flow_cols.tolist(),
+                                               moved[segment_rows, flow_cols].tolist())
+            )
+            return flow_results
+        
+        for i, f, success_count, population_count in zip(
+                segment_rows.tolist(), flow_cols.tolist(),
+                moved[segment_rows, flow_cols].tolist(),
+                available[segment_rows, flow_cols].tolist()):
+            segment = segments[i]
+            flow_id, source_id, target_id = flows[f]
+            flow_results.append(ProcessResult(
+                source_state=source_id,
+                target_state=target_id,
+                population_count=population_count,
+                success_count=success_count,
+                failure_count=0,
+                segment_id=segment.segment_id,
+                flow_id=flow_id,
+                region_id=self.region_id,
+                cohort_type=segment.cohort_type,
+                age_bracket=segment.age_bracket.bracket_name
+            ))
         
         return flow_results
     
+    def _plan_flows(self, flow_definitions, config_manager, merged_config):
+        """
+        Resolve flows to population array columns and build the base rate matrix.
+        
+        Args:
+            flow_definitions (dict): Flow definitions to process.
+            config_manager (ConfigurationManager): Configuration manager.
+            merged_config (Mapping): Merged configuration the rates are read from.
+            
+        Returns:
+            tuple: (flow_definitions, merged_config, flows, source_idx, target_idx,
+                rates), where flows lists (flow_id, source, target) for each known
+                flow and rates is the unadjusted (segments, flows) rate array.
+        """
+        state_index = {state_id: i for i, state_id in enumerate(self.state_ids)}
+        flows = []
+        for flow_id, flow_def in flow_definitions.items():
+            source_id = flow_def.get('source')
+            target_id = flow_def.get('target')
+            if source_id not in state_index or target_id not in state_index:
+                logger.warning(f"Skipping flow {flow_id} with unknown state "
+                               f"{source_id} -> {target_id} in region {self.region_id}")
+                continue
+            flows.append((flow_id, source_id, target_id))
+        
+        source_idx = np.array([state_index[source_id] for _, source_id, _ in flows],
+                              dtype=np.int64)
+        target_idx = np.array([state_index[target_id] for _, _, target_id in flows],
+                              dtype=np.int64)
+        rates = np.array(
+            [[config_manager.get_flow_rate(flow_id, segment.cohort_type,
+                                           segment.age_bracket.bracket_name)
+              for flow_id, _, _ in flows]
+             for segment in self.population_segments],
+            dtype=np.float64
+        ).reshape(len(self.population_segments), len(flows))
+        
+        return flow_definitions, merged_config, flows, source_idx, target_idx, rates
+    
     def calculate_regional_statistics(self):
         """
         Calculate region-level statistics.
@@ -155,13 +327,8 @@ class Region:
         
         # Aggregate state populations across all segments
         if self.population_segments:
-            # Get state IDs from first segment
-            state_ids = list(self.population_segments[0].states.keys())
-            
-            for state_id in state_ids:
-                total = sum(segment.get_state_population(state_id) 
-                           for segment in self.population_segments)
-                stats['state_populations'][state_id] = total
+            totals = self.populations.sum(axis=0).tolist()
+            stats['state_populations'] = dict(zip(self._state_ids, totals))
         
         return stats
     
@@ -170,19 +337,24 @@ class Region:
         Apply regional adjustment factors to base rates.
         
         Args:
-            base_rates (dict): Dictionary of base rates to adjust.
+            base_rates (dict or numpy.ndarray): Dictionary of base rates to adjust,
+                or an array of rates, such as a (segments, flows) rate matrix.
             factor_type (str): Type of adjustment factor to apply.
             
         Returns:
-            dict: Dictionary of adjusted rates.
+            dict or numpy.ndarray: Adjusted rates, of the same type as base_rates.
         """
+        adjustment = self.regional_factors.get(factor_type)
+        
+        # Arrays are adjusted with a single multiply
+        if isinstance(base_rates, np.ndarray):
+            return base_rates * adjustment if adjustment is not None else base_rates.copy()
+        
         # In Phase 1, implement a simple adjustment
         adjusted_rates = base_rates.copy()
         
         # Apply regional factors if available
-        if factor_type in self.regional_factors:
-            adjustment = self.regional_factors[factor_type]
-            
+        if adjustment is not None:
             for rate_id, rate in adjusted_rates.items():
                 if isinstance(rate, (int, float)):
                     adjusted_rates[rate_id] = rate * adjustment
@@ -196,7 +368,12 @@ class Region:
         Returns:
             int: Total population across all segments.
         """
-        return sum(segment.population_size for segment in self.population_segments)
+        if self._segment_sizes is None:
+            self._segment_sizes = np.fromiter(
+                (segment.population_size for segment in self.population_segments),
+                dtype=np.int64, count=len(self.population_segments)
+            )
+        return int(self._segment_sizes.sum())
     
     def get_segment_by_id(self, segment_id):
         """
@@ -208,36 +385,85 @@ class Region:
         Returns:
             PopulationSegment: Found segment, or None if not found.
         """
-        for segment in self.population_segments:
-            if segment.segment_id == segment_id:
-                return segment
-        return None
+        return self._segment_index.get(segment_id)
     
-    def record_state_history(self, period_id):
+    def record_state_history(self, period_id, reuse_previous=False):
         """
         Record historical state values for all segments.
         
+        The whole populations array is copied at once. Recorded values are
+        read back through ProcessState.get_historical_value or
+        get_state_history.
+        
         Args:
             period_id (str): Identifier for the time period.
+            reuse_previous (bool): If True, share the previous snapshot instead
+                of copying, for callers that know no population has changed.
         """
-        for segment in self.population_segments:
-            segment.record_state_history(period_id)
+        populations = self.populations
+        snapshot = None
+        if reuse_previous and self._state_history:
+            snapshot = next(reversed(self._state_history.values()))
+        if snapshot is None or snapshot.shape != populations.shape:
+            snapshot = populations.copy()
+        self._state_history[period_id] = snapshot
+    
+    def get_state_history(self):
+        """
+        Get recorded state populations for all periods.
+        
+        Returns:
+            dict: Dictionary with 'periods', 'segments' and 'states' labels and a
+                'values' array of shape (periods, segments, states). Segments
+                added after a period was recorded have zeros for that period.
+        """
+        populations = self.populations
+        values = np.zeros((len(self._state_history),) + populations.shape, dtype=np.int64)
+        for i, snapshot in enumerate(self._state_history.values()):
+            values[i, :snapshot.shape[0], :snapshot.shape[1]] = snapshot
+        
+        return {
+            'periods': list(self._state_history),
+            'segments': [segment.segment_id for segment in self.population_segments],
+            'states': list(self._state_ids),
+            'values': values
+        }
     
     def reset_annual_states(self):
         """
         Reset states that should reset on fiscal year change for all segments.
         
+        Reset populations move to the re-enrollment eligible state. When all
+        segments share the same states, this is done with array operations
+        on the whole region.
+        
         Returns:
             dict: Dictionary mapping segment_id to reset results.
         """
-        reset_results = {}
+        populations = self.populations
+        reset_columns = self._reset_columns
         
-        for segment in self.population_segments:
-            reset_populations = segment.reset_annual_states()
-            if reset_populations:
-                reset_results[segment.segment_id] = reset_populations
+        if reset_columns is None:
+            reset_results = {}
+            
+            for segment in self.population_segments:
+                reset_populations = segment.reset_annual_states()
+                if reset_populations:
+                    reset_results[segment.segment_id] = reset_populations
+            
+            return reset_results
+        
+        if not reset_columns:
+            return {}
+        
+        previous = populations[:, reset_columns]
+        populations[:, reset_columns] = 0
+        if self._re_enroll_column is not None:
+            populations[:, self._re_enroll_column] += previous.sum(axis=1)
         
-        return reset_results
+        reset_ids = [self._state_ids[i] for i in reset_columns]
+        return {segment.segment_id: dict(zip(reset_ids, row))
+                for segment, row in zip(self.population_segments, previous.tolist())}
     
     def __str__(self):
         """Return string representation of the Region."""
@@ -11,6 +11,11 @@ from .state import ProcessState
 
 logger = logging.getLogger(__name__)
 
+# States every segment must have, in reporting order
+REQUIRED_STATES = ('eligible', 're_enrollment_eligible', 'applied',
+                   'enrolled_inactive', 'active_claimant')
+_REQUIRED_STATE_SET = frozenset(REQUIRED_STATES)
+
 
 class AgeBracket:
     """
@@ -20,6 +25,9 @@ class AgeBracket:
     targeting specific demographic groups in the simulation.
     """
     
+    __slots__ = ('age_min', 'age_max', 'bracket_name', '_eligibility_start_date',
+                 '_eligibility_ordinal')
+    
     def __init__(self, age_min, age_max, bracket_name, eligibility_start_date=None):
         """
         Initialize with age range and name.
@@ -28,7 +36,7 @@ class AgeBracket:
             age_min (int): Minimum age (inclusive).
             age_max (int): Maximum age (inclusive).
             bracket_name (str): Descriptive name for the age bracket.
-            eligibility_start_date (date, optional): Date when this age bracket
+            eligibility_start_date (date or str, optional): Date when this age bracket
                 becomes eligible. If None, eligibility determined by rollout schedule.
         """
         self.age_min = age_min
@@ -36,21 +44,38 @@ class AgeBracket:
         self.bracket_name = bracket_name
         self.eligibility_start_date = eligibility_start_date
     
+    @property
+    def eligibility_start_date(self):
+        """date: Date when this age bracket becomes eligible, or None."""
+        return self._eligibility_start_date
+    
+    @eligibility_start_date.setter
+    def eligibility_start_date(self, value):
+        # Quoted YAML dates arrive as ISO strings
+        if isinstance(value, str):
+            value = date.fromisoformat(value)
+        self._eligibility_start_date = value
+        # Day ordinal compared against instead of the date; -1 means always eligible
+        self._eligibility_ordinal = value.toordinal() if value is not None else -1
+    
     def is_eligible(self, current_date):
         """
         Check if age bracket is eligible at current date.
         
         Args:
-            current_date (date): Current date in the simulation.
+            current_date (date or int): Current date in the simulation, or its
+                proleptic Gregorian ordinal.
             
         Returns:
             bool: True if age bracket is eligible at the current date.
         """
-        if self.eligibility_start_date is None:
+        if self._eligibility_ordinal < 0:
             # If no specific eligibility date, assume eligible
             return True
         
-        return current_date >= self.eligibility_start_date
+        if not isinstance(current_date, int):
+            current_date = current_date.toordinal()
+        return current_date >= self._eligibility_ordinal
     
     def __str__(self):
         """Return string representation of the AgeBracket."""
@@ -68,6 +93,9 @@ class PopulationSegment:
     process states.
     """
     
+    __slots__ = ('segment_id', 'cohort_type', 'age_bracket', 'region_id',
+                 'population_size', 'states', 'income_distribution', '_str_cache')
+    
     def __init__(self, segment_id, cohort_type, age_bracket, region_id, population_size):
         """
         Initialize with segment parameters.
@@ -88,6 +116,9 @@ class PopulationSegment:
         
         # For Phase 1, we'll use a simple income distribution (can be extended later)
         self.income_distribution = {"low": 0.3, "medium": 0.5, "high": 0.2}
+        
+        # String form, built on first use; its fields do not change after init
+        self._str_cache = None
     
     def initialize_states(self, state_definitions):
         """
@@ -100,15 +131,15 @@ class PopulationSegment:
             dict: Dictionary of initialized ProcessState objects.
         """
         # Log the states we're initializing
-        logger.debug(f"Initializing states for segment {self.segment_id}")
-        logger.debug(f"State definitions: {state_definitions}")
+        logger.debug("Initializing states for segment %s", self.segment_id)
+        logger.debug("State definitions: %s", state_definitions)
         
         for state_key, state_def in state_definitions.items():
             # Get the inner ID from the state definition
             state_id = state_def['id']
             
             # Log the state we're creating
-            logger.debug(f"Creating state {state_id} from definition {state_key}")
+            logger.debug("Creating state %s from definition %s", state_id, state_key)
             
             reset_on_fiscal_year = state_def.get('reset_on_fiscal_year', False)
             state = ProcessState(
@@ -123,7 +154,7 @@ class PopulationSegment:
         # Initially place entire population in eligible state
         if 'eligible' in self.states:
             self.states['eligible'].set_population(self.population_size)
-            logger.debug(f"Set initial population for 'eligible' state: {self.population_size}")
+            logger.debug("Set initial population for 'eligible' state: %s", self.population_size)
         else:
             logger.warning(f"'eligible' state not found for segment {self.segment_id}")
         
@@ -139,12 +170,10 @@ class PopulationSegment:
         Returns:
             bool: True if all required states are present, False otherwise.
         """
-        required_states = ['eligible', 're_enrollment_eligible', 'applied', 
-                          'enrolled_inactive', 'active_claimant']
+        missing = _REQUIRED_STATE_SET - self.states.keys()
         
-        missing_states = [state for state in required_states if state not in self.states]
-        
-        if missing_states:
+        if missing:
+            missing_states = [state for state in REQUIRED_STATES if state in missing]
             logger.error(f"Segment {self.segment_id} missing required states: {missing_states}")
             logger.error(f"Available states: {list(self.states.keys())}")
             return False
@@ -161,9 +190,9 @@ class PopulationSegment:
         Returns:
             int: Population count in the specified state.
         """
-        if state_id in self.states:
-            return self.states[state_id].get_population()
-        else:
+        try:
+            return self.states[state_id].population
+        except KeyError:
             logger.warning(f"Requested unknown state {state_id} in segment {self.segment_id}")
             return 0
     
@@ -274,5 +303,7 @@ class PopulationSegment:
     
     def __str__(self):
         """Return string representation of the PopulationSegment."""
-        return (f"PopulationSegment({self.segment_id}, {self.cohort_type}, "
-                f"{self.age_bracket}, population={self.population_size})")
\ No newline at end of file
+        if self._str_cache is None:
+            self._str_cache = (f"PopulationSegment({self.segment_id}, {self.cohort_type}, "
+                               f"{self.age_bracket}, population={self.population_size})")
+        return self._str_cache
\ No newline at end of file
@@ -18,6 +18,9 @@ class ProcessState:
     the simulation, such as 'eligible', 'applied', 'enrolled_inactive', etc.
     """
     
+    __slots__ = ('state_id', 'state_name', 'reset_on_fiscal_year', '_population',
+                 '_cells', '_cell', '_history', 'historical_values')
+    
     def __init__(self, state_id, state_name, reset_on_fiscal_year=False):
         """
         Initialize with state identifier and name.
@@ -29,12 +32,50 @@ class ProcessState:
         """
         self.state_id = state_id
         self.state_name = state_name
-        self.population = 0
         self.reset_on_fiscal_year = reset_on_fiscal_year
         
+        # Population is held here until the state is bound to a cell of its
+        # region's population array
+        self._population = 0
+        self._cells = None
+        self._cell = None
+        self._history = None  # Region snapshots by period once bound
+        
         # For tracking historical population values
         self.historical_values = {}
     
+    @property
+    def population(self):
+        """int: Current population count."""
+        if self._cells is None:
+            return self._population
+        return int(self._cells[self._cell])
+    
+    @population.setter
+    def population(self, count):
+        if self._cells is None:
+            self._population = count
+        else:
+            self._cells[self._cell] = count
+    
+    def bind(self, cells, index, history=None):
+        """
+        Store this state's population in an element of a shared array.
+        
+        The current population is copied into the array, which then becomes
+        the only copy of the count.
+        
+        Args:
+            cells (numpy.ndarray): Integer array holding the population.
+            index (tuple): Index of this state's element in the array.
+            history (dict, optional): Maps period_id to recorded copies of the
+                array, read by get_historical_value.
+        """
+        cells[index] = self.population
+        self._cells = cells
+        self._cell = index
+        self._history = history
+    
     def get_population(self):
         """
         Get current population in this state.
@@ -116,7 +157,12 @@ class ProcessState:
         Returns:
             int: Historical population count, or None if not recorded.
         """
-        return self.historical_values.get(period_id)
+        value = self.historical_values.get(period_id)
+        if value is None and self._history is not None:
+            snapshot = self._history.get(period_id)
+            if snapshot is not None and self._cell[0] < snapshot.shape[0]:
+                value = int(snapshot[self._cell])
+        return value
     
     def should_reset_on_fiscal_year(self):
         """
@@ -6,6 +6,7 @@ the result of a process step execution.
 """
 
 import logging
+from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,15 @@ class ProcessResult:
     population movement, success/failure counts, and any financial impacts.
     """
     
+    # One result is created per segment and flow each period, so avoid a
+    # per-instance __dict__
+    __slots__ = (
+        'source_state', 'target_state', 'population_count', 'success_count',
+        'failure_count', 'segment_id', 'flow_id', 'region_id', 'cohort_type',
+        'age_bracket', 'financial_impact', 'program_payment', 'patient_payment',
+        'service_mix'
+    )
+    
     def __init__(self, source_state, target_state, population_count, 
                 success_count=0, failure_count=0, segment_id=None, flow_id=None,
                 region_id=None, cohort_type=None, age_bracket=None):
@@ -142,6 +152,54 @@ class ProcessResult:
                     age_bracket=self.age_bracket
                 )
     
+    @classmethod
+    def add_many_to_statistics(cls, results, statistics_tracker, time_manager, period=None):
+        """
+        Add a batch of results to the statistics tracker.
+        
+        Flow and financial values are summed per metric and dimensions
+        (segment, region, cohort and age bracket), then
+        recorded with one bulk tracker call per metric type instead of up to
+        four calls per result.
+        
+        Args:
+            results (iterable): ProcessResult objects to record.
+            statistics_tracker (StatisticsTracker): Statistics tracker to update.
+            time_manager (TimeManager): Time manager for current period.
+            period (str, optional): Period to record under. If None, it is taken
+                from the time manager.
+        """
+        if period is None:
+            period = time_manager.get_current_period()
+        
+        flow_counts = defaultdict(int)
+        financial_amounts = defaultdict(float)
+        
+        # ProcessResult always defines flow and financial fields (None/0.0 defaults)
+        for result in results:
+            dimensions = (result.segment_id, result.region_id,
+                          result.cohort_type, result.age_bracket)
+            
+            if result.flow_id:
+                flow_counts[(result.flow_id,) + dimensions] += result.success_count
+            
+            # Add financial impact if present
+            if result.financial_impact > 0:
+                financial_amounts[('claim_expenditure',) + dimensions] += result.financial_impact
+                
+                if result.program_payment > 0:
+                    financial_amounts[('program_expenditure',) + dimensions] += result.program_payment
+                
+                if result.patient_payment > 0:
+                    financial_amounts[('patient_expenditure',) + dimensions] += result.patient_payment
+        
+        statistics_tracker.update_flow_metrics_bulk(
+            period, [key + (count,) for key, count in flow_counts.items()]
+        )
+        statistics_tracker.update_financial_metrics_bulk(
+            period, [key + (amount,) for key, amount in financial_amounts.items()]
+        )
+    
     def __str__(self):
         """Return string representation of the ProcessResult."""
         result = (f"ProcessResult({self.source_state} → {self.target_state}, "
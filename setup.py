@@ -30,6 +30,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "fast": ["numba>=0.57", "orjson>=3.6"],
+    },
     entry_points={
         "console_scripts": [
             "ohb-sim=expenditure_forecast.main:main",
@@ -5,11 +5,16 @@ This module provides the StatisticsTracker class, which tracks all statistics
 during simulation using a normalized data structure.
 """
 
+import csv
 import logging
 from collections import defaultdict
+from contextlib import ExitStack
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for CSV exports, so rows are written in large chunks
+_CSV_BUFFER_SIZE = 1024 * 1024
+
 
 class StatisticsTracker:
     """
@@ -26,8 +31,17 @@ class StatisticsTracker:
         self.metrics = []
         
         # Keep a cache of metrics for efficient lookup during simulation
-        # This avoids having to search through the metrics list repeatedly
-        self._metric_cache = defaultdict(dict)
+        # This avoids having to search through the metrics list repeatedly.
+        # Keys are (type, id, period, region, cohort, age_bracket, segment) tuples.
+        self._metric_cache = {}
+        
+        # Dimension tuples (region, cohort, age_bracket, segment) seen in the cache,
+        # kept as an insertion-ordered dict
+        self._dimensions = {("ALL", "ALL", "ALL", "ALL"): None}
+        
+        # Total ("ALL") flow and financial records by cache key, so each metric
+        # keeps a single total record per period that later updates add to
+        self._total_records = {}
     
     def update_state_metrics(self, regions, time_manager):
         """
@@ -42,6 +56,7 @@ class StatisticsTracker:
         """
         period = time_manager.get_current_period()
         new_metrics = []
+        dimensions = self._dimensions
         
         # Calculate total population across all regions first
         total_by_state = defaultdict(int)
@@ -54,14 +69,15 @@ class StatisticsTracker:
             # Calculate region totals
             region_total_by_state = defaultdict(int)
             
-            for segment in region.population_segments:
+            # Read every segment's populations from the region's array at once
+            state_ids = region.state_ids
+            for segment, row in zip(region.population_segments, region.populations.tolist()):
                 segment_id = segment.segment_id
                 cohort_type = segment.cohort_type
                 age_bracket = segment.age_bracket.bracket_name
+                dimensions[(region_id, cohort_type, age_bracket, segment_id)] = None
                 
-                for state_id, state in segment.states.items():
-                    population = state.get_population()
-                    
+                for state_id, population in zip(state_ids, row):
                     # Skip zero population states
                     if population <= 0:
                         continue
@@ -80,7 +96,7 @@ class StatisticsTracker:
                     new_metrics.append(segment_metric)
                     
                     # Update cache for this specific metric
-                    cache_key = f"state:{state_id}:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+                    cache_key = ("state", state_id, period, region_id, cohort_type, age_bracket, segment_id)
                     self._metric_cache[cache_key] = population
                     
                     # Update aggregation counters
@@ -90,6 +106,7 @@ class StatisticsTracker:
                     total_by_state_age[state_id][age_bracket] += population
             
             # Add region-level aggregated metrics
+            dimensions[(region_id, "ALL", "ALL", "ALL")] = None
             for state_id, population in region_total_by_state.items():
                 region_metric = {
                     "type": "state",
@@ -104,12 +121,13 @@ class StatisticsTracker:
                 new_metrics.append(region_metric)
                 
                 # Update cache
-                cache_key = f"state:{state_id}:{period}:{region_id}:ALL:ALL:ALL"
+                cache_key = ("state", state_id, period, region_id, "ALL", "ALL", "ALL")
                 self._metric_cache[cache_key] = population
         
         # Add cohort-level aggregated metrics
         for state_id, cohorts in total_by_state_cohort.items():
             for cohort_type, population in cohorts.items():
+                dimensions[("ALL", cohort_type, "ALL", "ALL")] = None
                 cohort_metric = {
                     "type": "state",
                     "id": state_id,
@@ -123,12 +141,13 @@ class StatisticsTracker:
                 new_metrics.append(cohort_metric)
                 
                 # Update cache
-                cache_key = f"state:{state_id}:{period}:ALL:{cohort_type}:ALL:ALL"
+                cache_key = ("state", state_id, period, "ALL", cohort_type, "ALL", "ALL")
                 self._metric_cache[cache_key] = population
         
         # Add age-level aggregated metrics
         for state_id, ages in total_by_state_age.items():
             for age_bracket, population in ages.items():
+                dimensions[("ALL", "ALL", age_bracket, "ALL")] = None
                 age_metric = {
                     "type": "state",
                     "id": state_id,
@@ -142,7 +161,7 @@ class StatisticsTracker:
                 new_metrics.append(age_metric)
                 
                 # Update cache
-                cache_key = f"state:{state_id}:{period}:ALL:ALL:{age_bracket}:ALL"
+                cache_key = ("state", state_id, period, "ALL", "ALL", age_bracket, "ALL")
                 self._metric_cache[cache_key] = population
         
         # Add total-level aggregated metrics
@@ -160,7 +179,7 @@ class StatisticsTracker:
             new_metrics.append(total_metric)
             
             # Update cache
-            cache_key = f"state:{state_id}:{period}:ALL:ALL:ALL:ALL"
+            cache_key = ("state", state_id, period, "ALL", "ALL", "ALL", "ALL")
             self._metric_cache[cache_key] = population
         
         # Add new metrics to the overall list
@@ -171,22 +190,19 @@ class StatisticsTracker:
         
         return new_metrics
     
-    def update_flow_metric(self, flow_id, period, count, segment_id=None, region_id=None, 
-                          cohort_type=None, age_bracket=None):
+    def _resolve_dimensions(self, segment_id, region_id=None, cohort_type=None, age_bracket=None):
         """
-        Update a specific flow metric.
+        Fill in missing metric dimensions, deriving them from segment_id if possible.
         
         Args:
-            flow_id (str): Flow identifier.
-            period (str): Time period identifier.
-            count (int): Flow count to add.
-            segment_id (str, optional): Segment identifier for segmented metrics.
+            segment_id (str): Segment identifier, or None.
             region_id (str, optional): Region identifier.
             cohort_type (str, optional): Cohort type.
             age_bracket (str, optional): Age bracket.
             
         Returns:
-            dict: The created or updated metric record.
+            tuple: (region_id, cohort_type, age_bracket, segment_id), with "ALL"
+                for any dimension that could not be determined.
         """
         # If segment_id is provided but other dimensions aren't, extract them from segment_id
         if segment_id and (not region_id or not cohort_type or not age_bracket):
@@ -202,10 +218,29 @@ class StatisticsTracker:
                         region_id = parts[2]
         
         # Default values for missing dimensions
-        region_id = region_id or "ALL"
-        cohort_type = cohort_type or "ALL"
-        age_bracket = age_bracket or "ALL"
-        segment_id = segment_id or "ALL"
+        return (region_id or "ALL", cohort_type or "ALL",
+                age_bracket or "ALL", segment_id or "ALL")
+    
+    def update_flow_metric(self, flow_id, period, count, segment_id=None, region_id=None, 
+                          cohort_type=None, age_bracket=None):
+        """
+        Update a specific flow metric.
+        
+        Args:
+            flow_id (str): Flow identifier.
+            period (str): Time period identifier.
+            count (int): Flow count to add.
+            segment_id (str, optional): Segment identifier for segmented metrics.
+            region_id (str, optional): Region identifier.
+            cohort_type (str, optional): Cohort type.
+            age_bracket (str, optional): Age bracket.
+            
+        Returns:
+            dict: The created or updated metric record.
+        """
+        region_id, cohort_type, age_bracket, segment_id = self._resolve_dimensions(
+            segment_id, region_id, cohort_type, age_bracket
+        )
         
         # Create flow metric record
         flow_metric = {
@@ -223,29 +258,15 @@ class StatisticsTracker:
         self.metrics.append(flow_metric)
         
         # Update cache
-        cache_key = f"flow:{flow_id}:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+        cache_key = ("flow", flow_id, period, region_id, cohort_type, age_bracket, segment_id)
+        self._dimensions[(region_id, cohort_type, age_bracket, segment_id)] = None
         
         # Sum with any existing value in cache
         current_value = self._metric_cache.get(cache_key, 0)
         self._metric_cache[cache_key] = current_value + count
         
         # Also update the total flow metric
-        total_cache_key = f"flow:{flow_id}:{period}:ALL:ALL:ALL:ALL"
-        total_current = self._metric_cache.get(total_cache_key, 0)
-        total_value = total_current + count
-        self._metric_cache[total_cache_key] = total_value
-        
-        # Add/update total metric record if needed
-        self.metrics.append({
-            "type": "flow",
-            "id": flow_id,
-            "period": period,
-            "region": "ALL",
-            "cohort": "ALL",
-            "age_bracket": "ALL",
-            "segment": "ALL",
-            "value": total_value
-        })
+        self._add_to_total("flow", flow_id, period, count)
         
         return flow_metric
     
@@ -266,23 +287,9 @@ class StatisticsTracker:
         Returns:
             dict: The created or updated metric record.
         """
-        # Similar parsing as update_flow_metric
-        if segment_id and (not region_id or not cohort_type or not age_bracket):
-            if '_' in segment_id:
-                parts = segment_id.split('_')
-                if len(parts) >= 3:
-                    if not cohort_type:
-                        cohort_type = parts[0]
-                    if not age_bracket:
-                        age_bracket = parts[1]
-                    if not region_id:
-                        region_id = parts[2]
-        
-        # Default values for missing dimensions
-        region_id = region_id or "ALL"
-        cohort_type = cohort_type or "ALL"
-        age_bracket = age_bracket or "ALL"
-        segment_id = segment_id or "ALL"
+        region_id, cohort_type, age_bracket, segment_id = self._resolve_dimensions(
+            segment_id, region_id, cohort_type, age_bracket
+        )
         
         # Create financial metric record
         financial_metric = {
@@ -300,32 +307,137 @@ class StatisticsTracker:
         self.metrics.append(financial_metric)
         
         # Update cache
-        cache_key = f"financial:{metric_id}:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+        cache_key = ("financial", metric_id, period, region_id, cohort_type, age_bracket, segment_id)
+        self._dimensions[(region_id, cohort_type, age_bracket, segment_id)] = None
         
         # Sum with any existing value in cache
         current_value = self._metric_cache.get(cache_key, 0)
         self._metric_cache[cache_key] = current_value + amount
         
         # Also update the total financial metric
-        total_cache_key = f"financial:{metric_id}:{period}:ALL:ALL:ALL:ALL"
-        total_current = self._metric_cache.get(total_cache_key, 0)
-        total_value = total_current + amount
-        self._metric_cache[total_cache_key] = total_value
-        
-        # Add/update total metric record if needed
-        self.metrics.append({
-            "type": "financial",
-            "id": metric_id,
-            "period": period,
-            "region": "ALL",
-            "cohort": "ALL",
-            "age_bracket": "ALL",
-            "segment": "ALL",
-            "value": total_value
-        })
+        self._add_to_total("financial", metric_id, period, amount)
         
         return financial_metric
     
+    def update_flow_metrics_bulk(self, period, entries):
+        """
+        Update flow metrics for a whole period in one call.
+        
+        Each flow's total ("ALL") record is appended once, after all of its
+        segment records, rather than once per segment.
+        
+        Args:
+            period (str): Time period identifier.
+            entries (iterable): (flow_id, segment_id, region_id, cohort_type,
+                age_bracket, count) tuples, with counts already aggregated per
+                flow and dimensions. Missing dimensions are derived from
+                segment_id as in update_flow_metric.
+            
+        Returns:
+            list: The created segment-level metric records.
+        """
+        return self._update_metrics_bulk("flow", period, entries)
+    
+    def update_financial_metrics_bulk(self, period, entries):
+        """
+        Update financial metrics for a whole period in one call.
+        
+        Each metric's total ("ALL") record is appended once, after all of its
+        segment records, rather than once per segment.
+        
+        Args:
+            period (str): Time period identifier.
+            entries (iterable): (metric_id, segment_id, region_id, cohort_type,
+                age_bracket, amount) tuples, with amounts already aggregated per
+                metric and dimensions. Missing dimensions are derived from
+                segment_id as in update_financial_metric.
+            
+        Returns:
+            list: The created segment-level metric records.
+        """
+        return self._update_metrics_bulk("financial", period, entries)
+    
+    def _update_metrics_bulk(self, metric_type, period, entries):
+        """
+        Append segment-level records and one total record per metric id.
+        
+        Args:
+            metric_type (str): Metric type ("flow" or "financial").
+            period (str): Time period identifier.
+            entries (iterable): (metric_id, segment_id, region_id, cohort_type,
+                age_bracket, value) tuples.
+            
+        Returns:
+            list: The created segment-level metric records.
+        """
+        new_metrics = []
+        totals = {}
+        cache = self._metric_cache
+        dimensions = self._dimensions
+        
+        for metric_id, segment_id, region_id, cohort_type, age_bracket, value in entries:
+            region_id, cohort_type, age_bracket, segment_id = self._resolve_dimensions(
+                segment_id, region_id, cohort_type, age_bracket
+            )
+            
+            new_metrics.append({
+                "type": metric_type,
+                "id": metric_id,
+                "period": period,
+                "region": region_id,
+                "cohort": cohort_type,
+                "age_bracket": age_bracket,
+                "segment": segment_id,
+                "value": value
+            })
+            
+            cache_key = (metric_type, metric_id, period, region_id, cohort_type, age_bracket, segment_id)
+            dimensions[(region_id, cohort_type, age_bracket, segment_id)] = None
+            cache[cache_key] = cache.get(cache_key, 0) + value
+            totals[metric_id] = totals.get(metric_id, 0) + value
+        
+        self.metrics.extend(new_metrics)
+        
+        # Update the total metric record once per metric id
+        for metric_id, value in totals.items():
+            self._add_to_total(metric_type, metric_id, period, value)
+        
+        return new_metrics
+    
+    def _add_to_total(self, metric_type, metric_id, period, value):
+        """
+        Add a value to the total ("ALL") record of a metric for a period.
+        
+        The record is appended the first time the metric is seen in the period
+        and updated in place afterwards.
+        
+        Args:
+            metric_type (str): Metric type ("flow" or "financial").
+            metric_id (str): Metric identifier.
+            period (str): Time period identifier.
+            value (int or float): Value to add.
+        """
+        total_cache_key = (metric_type, metric_id, period, "ALL", "ALL", "ALL", "ALL")
+        total_value = self._metric_cache.get(total_cache_key, 0) + value
+        self._metric_cache[total_cache_key] = total_value
+        
+        total_metric = self._total_records.get(total_cache_key)
+        if total_metric is None:
+            total_metric = {
+                "type": metric_type,
+                "id": metric_id,
+                "period": period,
+                "region": "ALL",
+                "cohort": "ALL",
+                "age_bracket": "ALL",
+                "segment": "ALL",
+                "value": total_value
+            }
+            self._total_records[total_cache_key] = total_metric
+            self.metrics.append(total_metric)
+        else:
+            total_metric["value"] = total_value
+    
     def calculate_derived_state_metrics(self, period):
         """
         Calculate metrics derived from state metrics.
@@ -345,8 +457,8 @@ class StatisticsTracker:
             region_id, cohort_type, age_bracket, segment_id = dim
             
             # Calculate total_eligible_population
-            eligible_key = f"state:eligible:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
-            re_enrollment_key = f"state:re_enrollment_eligible:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+            eligible_key = ("state", "eligible", period, region_id, cohort_type, age_bracket, segment_id)
+            re_enrollment_key = ("state", "re_enrollment_eligible", period, region_id, cohort_type, age_bracket, segment_id)
             
             eligible = self._metric_cache.get(eligible_key, 0)
             re_enrollment_eligible = self._metric_cache.get(re_enrollment_key, 0)
@@ -366,11 +478,11 @@ class StatisticsTracker:
                 })
                 
                 # Update cache
-                self._metric_cache[f"derived:total_eligible_population:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"] = total_eligible
+                self._metric_cache[("derived", "total_eligible_population", period, region_id, cohort_type, age_bracket, segment_id)] = total_eligible
                 
                 # Calculate total_enrolled_population
-                enrolled_inactive_key = f"state:enrolled_inactive:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
-                active_claimant_key = f"state:active_claimant:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+                enrolled_inactive_key = ("state", "enrolled_inactive", period, region_id, cohort_type, age_bracket, segment_id)
+                active_claimant_key = ("state", "active_claimant", period, region_id, cohort_type, age_bracket, segment_id)
                 
                 enrolled_inactive = self._metric_cache.get(enrolled_inactive_key, 0)
                 active_claimant = self._metric_cache.get(active_claimant_key, 0)
@@ -389,7 +501,7 @@ class StatisticsTracker:
                 })
                 
                 # Update cache
-                self._metric_cache[f"derived:total_enrolled_population:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"] = total_enrolled
+                self._metric_cache[("derived", "total_enrolled_population", period, region_id, cohort_type, age_bracket, segment_id)] = total_enrolled
                 
                 # Calculate enrollment_rate
                 if total_eligible > 0:
@@ -408,7 +520,7 @@ class StatisticsTracker:
                     })
                     
                     # Update cache
-                    self._metric_cache[f"derived:enrollment_rate:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"] = enrollment_rate
+                    self._metric_cache[("derived", "enrollment_rate", period, region_id, cohort_type, age_bracket, segment_id)] = enrollment_rate
         
         # Add derived metrics to the overall list
         self.metrics.extend(derived_metrics)
@@ -434,13 +546,13 @@ class StatisticsTracker:
             region_id, cohort_type, age_bracket, segment_id = dim
             
             # Get claim expenditure
-            claim_expenditure_key = f"financial:claim_expenditure:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+            claim_expenditure_key = ("financial", "claim_expenditure", period, region_id, cohort_type, age_bracket, segment_id)
             claim_expenditure = self._metric_cache.get(claim_expenditure_key, 0)
             
             if claim_expenditure > 0:
                 # Get new enrollments and re-enrollments
-                enrollments_key = f"flow:new_enrollments:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
-                re_enrollments_key = f"flow:new_re_enrollment:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+                enrollments_key = ("flow", "new_enrollments", period, region_id, cohort_type, age_bracket, segment_id)
+                re_enrollments_key = ("flow", "new_re_enrollment", period, region_id, cohort_type, age_bracket, segment_id)
                 
                 new_enrollments = self._metric_cache.get(enrollments_key, 0)
                 new_re_enrollment = self._metric_cache.get(re_enrollments_key, 0)
@@ -463,11 +575,11 @@ class StatisticsTracker:
                     })
                     
                     # Update cache
-                    self._metric_cache[f"derived:expenditure_per_enrollee:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"] = expenditure_per_enrollee
+                    self._metric_cache[("derived", "expenditure_per_enrollee", period, region_id, cohort_type, age_bracket, segment_id)] = expenditure_per_enrollee
                 
                 # Get claims
-                first_claims_key = f"flow:new_first_claims:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
-                subsequent_claims_key = f"flow:new_subsequent_claims:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+                first_claims_key = ("flow", "new_first_claims", period, region_id, cohort_type, age_bracket, segment_id)
+                subsequent_claims_key = ("flow", "new_subsequent_claims", period, region_id, cohort_type, age_bracket, segment_id)
                 
                 first_claims = self._metric_cache.get(first_claims_key, 0)
                 subsequent_claims = self._metric_cache.get(subsequent_claims_key, 0)
@@ -490,7 +602,7 @@ class StatisticsTracker:
                     })
                     
                     # Update cache
-                    self._metric_cache[f"derived:expenditure_per_claim:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"] = expenditure_per_claim
+                    self._metric_cache[("derived", "expenditure_per_claim", period, region_id, cohort_type, age_bracket, segment_id)] = expenditure_per_claim
         
         # Add derived metrics to the overall list
         self.metrics.extend(derived_metrics)
@@ -514,8 +626,8 @@ class StatisticsTracker:
         # Reset cumulative expenditure at fiscal year start
         if time_manager.is_fiscal_year_start():
             # Clear the cache for cumulative_expenditure
-            for key in list(self._metric_cache.keys()):
-                if key.startswith("financial:cumulative_expenditure:"):
+            for key in self._metric_cache:
+                if key[0] == "financial" and key[1] == "cumulative_expenditure":
                     self._metric_cache[key] = 0
         
         # Get required metrics from cache for all dimensions
@@ -525,12 +637,12 @@ class StatisticsTracker:
             region_id, cohort_type, age_bracket, segment_id = dim
             
             # Get current period expenditure
-            current_expenditure_key = f"financial:claim_expenditure:{period}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+            current_expenditure_key = ("financial", "claim_expenditure", period, region_id, cohort_type, age_bracket, segment_id)
             current_expenditure = self._metric_cache.get(current_expenditure_key, 0)
             
             if current_expenditure > 0:
                 # Get current cumulative expenditure
-                cumulative_key = f"financial:cumulative_expenditure:{fiscal_year}:{region_id}:{cohort_type}:{age_bracket}:{segment_id}"
+                cumulative_key = ("financial", "cumulative_expenditure", fiscal_year, region_id, cohort_type, age_bracket, segment_id)
                 current_cumulative = self._metric_cache.get(cumulative_key, 0)
                 
                 # Add current expenditure to cumulative
@@ -591,23 +703,7 @@ class StatisticsTracker:
         Returns:
             list: List of dimension tuples (region, cohort, age_bracket, segment).
         """
-        dimensions = set()
-        
-        # Extract dimensions from cache keys
-        for key in self._metric_cache.keys():
-            if ":" in key:
-                parts = key.split(":")
-                if len(parts) >= 7:  # type:id:period:region:cohort:age:segment
-                    region = parts[3]
-                    cohort = parts[4]
-                    age = parts[5]
-                    segment = parts[6]
-                    dimensions.add((region, cohort, age, segment))
-        
-        # Always ensure the "ALL" dimension is included
-        dimensions.add(("ALL", "ALL", "ALL", "ALL"))
-        
-        return list(dimensions)
+        return list(self._dimensions)
     
     def get_all_metrics(self):
         """
@@ -715,32 +811,23 @@ class StatisticsTracker:
         Returns:
             dict: Dictionary mapping metric types to file paths.
         """
-        # Group metrics by type
-        metrics_by_type = {}
-        for metric in self.metrics:
-            metric_type = metric['type']
-            if metric_type not in metrics_by_type:
-                metrics_by_type[metric_type] = []
-            metrics_by_type[metric_type].append(metric)
-        
-        # Export each type to a separate CSV file
+        # Stream each metric to the file for its type in a single pass, opening
+        # files as their first metric is seen
         file_paths = {}
-        for metric_type, metrics in metrics_by_type.items():
-            if not metrics:
-                continue
-                
-            file_path = f"{base_path}_{metric_type}_metrics.csv"
-            
-            # Create CSV content
-            header = metrics[0].keys()
-            csv_rows = [','.join(str(row[col]) for col in header) for row in metrics]
-            csv_content = ','.join(header) + '\n' + '\n'.join(csv_rows)
-            
-            # Write to file
-            with open(file_path, 'w') as f:
-                f.write(csv_content)
-            
-            file_paths[metric_type] = file_path
+        writers = {}
+        with ExitStack() as stack:
+            for metric in self.metrics:
+                metric_type = metric['type']
+                writer = writers.get(metric_type)
+                if writer is None:
+                    file_path = f"{base_path}_{metric_type}_metrics.csv"
+                    f = stack.enter_context(
+                        open(file_path, 'w', newline='', buffering=_CSV_BUFFER_SIZE))
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(metric.keys())
+                    writers[metric_type] = writer
+                    file_paths[metric_type] = file_path
+                writer.writerow(metric.values())
         
         return file_paths
     
@@ -106,6 +106,46 @@ class TestConfigurationManager(unittest.TestCase):
         self.assertEqual(config_manager.scenario_name, "nonexistent_scenario")
         self.assertEqual(config_manager.scenario_config, {})
     
+    def test_load_scenario_configuration_cached(self):
+        """Test that unchanged scenario files are not parsed again."""
+        config_manager = ConfigurationManager(self.config_dir)
+        scenario_path = os.path.join(self.config_dir, "scenarios", "test_scenario.yaml")
+
+        config_manager.load_scenario_configuration("test_scenario")
+        first_config = config_manager.scenario_config
+        first_merged = config_manager.get_merged_config()
+
+        # Reloading the active scenario keeps the parsed and merged configuration
+        config_manager.load_scenario_configuration("test_scenario")
+        self.assertIs(config_manager.scenario_config, first_config)
+        self.assertIs(config_manager.get_merged_config(), first_merged)
+
+        # Rewriting the file forces a re-parse
+        with open(scenario_path, 'w') as file:
+            yaml.dump({'flow_rates': {'flow1': 0.3}}, file)
+
+        config_manager.load_scenario_configuration("test_scenario")
+        self.assertIsNot(config_manager.scenario_config, first_config)
+        self.assertEqual(config_manager.get_flow_rate('flow1', 'cohort1', 'all'), 0.3)
+
+    def test_reload_active_scenario_same_mtime(self):
+        """Test that a rewrite keeping the modification time is not skipped."""
+        config_manager = ConfigurationManager(self.config_dir)
+        scenario_path = os.path.join(self.config_dir, "scenarios", "test_scenario.yaml")
+
+        config_manager.load_scenario_configuration("test_scenario")
+        first_merged = config_manager.get_merged_config()
+        stat = os.stat(scenario_path)
+
+        # Simulate a filesystem too coarse to record the rewrite's timestamp
+        with open(scenario_path, 'w') as file:
+            yaml.dump({'flow_rates': {'flow1': 0.3}}, file)
+        os.utime(scenario_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        config_manager.load_scenario_configuration("test_scenario")
+        self.assertIsNot(config_manager.get_merged_config(), first_merged)
+        self.assertEqual(config_manager.get_flow_rate('flow1', 'cohort1', 'all'), 0.3)
+
     def test_get_merged_config(self):
         """Test merging base and scenario configurations."""
         config_manager = ConfigurationManager(self.config_dir)
@@ -123,6 +163,33 @@ class TestConfigurationManager(unittest.TestCase):
         self.assertIn('regions', merged_config)
         self.assertEqual(len(merged_config['regions']), 2)
     
+    def test_merged_config_cache(self):
+        """Test that the merged configuration is cached until reload."""
+        config_manager = ConfigurationManager(self.config_dir)
+
+        base_merged = config_manager.get_merged_config()
+        self.assertIs(config_manager.get_merged_config(), base_merged)
+        self.assertEqual(base_merged['flow_rates']['flow1'], 0.1)
+
+        # Loading a scenario invalidates the cached merge
+        config_manager.load_scenario_configuration("test_scenario")
+        scenario_merged = config_manager.get_merged_config()
+
+        self.assertIsNot(scenario_merged, base_merged)
+        self.assertEqual(scenario_merged['flow_rates']['flow1'], 0.15)
+
+    def test_merged_config_does_not_copy_base(self):
+        """Test that merging leaves the base configuration untouched."""
+        config_manager = ConfigurationManager(self.config_dir)
+        config_manager.load_scenario_configuration("test_scenario")
+
+        merged = config_manager.get_merged_config().to_dict()
+
+        self.assertEqual(merged['flow_rates'], {'flow1': 0.15, 'flow2': 0.2})
+        self.assertEqual(config_manager.base_config['flow_rates']['flow1'], 0.1)
+        self.assertEqual(list(merged), ['flow_rates', 'flows', 'simulation', 'states',
+                                        'population_segments', 'regions'])
+
     def test_get_flow_rate(self):
         """Test getting flow rates for different parameters."""
         config_manager = ConfigurationManager(self.config_dir)
@@ -139,6 +206,16 @@ class TestConfigurationManager(unittest.TestCase):
         # Test getting non-existent flow rate
         flow_rate = config_manager.get_flow_rate('flow3', 'cohort1', 'all')
         self.assertEqual(flow_rate, 0.0)
+
+    def test_get_flow_rate_after_reload(self):
+        """Test that resolved flow rates are refreshed when a scenario loads."""
+        config_manager = ConfigurationManager(self.config_dir)
+
+        self.assertEqual(config_manager.get_flow_rate('flow1', 'cohort1', 'all'), 0.1)
+
+        config_manager.load_scenario_configuration("test_scenario")
+
+        self.assertEqual(config_manager.get_flow_rate('flow1', 'cohort1', 'all'), 0.15)
     
     def test_get_state_definitions(self):
         """Test getting state definitions."""
@@ -192,6 +269,38 @@ class TestConfigurationManager(unittest.TestCase):
         # Invalid configuration
         self.assertFalse(config_manager.validate_configuration())
     
+    def test_peek_scenario_metadata(self):
+        """Test reading scenario metadata without loading the scenario."""
+        scenario_path = os.path.join(self.config_dir, "scenarios", "described.yaml")
+        with open(scenario_path, 'w') as file:
+            file.write("regions:\n"
+                       "  - region_id: region1\n"
+                       "description: A described scenario\n"
+                       "metadata:\n"
+                       "  author: analyst\n"
+                       "  tags: [baseline, test]\n"
+                       "flow_rates:\n"
+                       "  flow1: 0.5\n")
+
+        config_manager = ConfigurationManager(self.config_dir)
+
+        metadata = config_manager.peek_scenario_metadata("described")
+        self.assertEqual(metadata, {
+            'description': 'A described scenario',
+            'metadata': {'author': 'analyst', 'tags': ['baseline', 'test']}
+        })
+
+        # Falls back to a full load when the scan is cut short
+        self.assertEqual(config_manager.peek_scenario_metadata("described", max_events=3),
+                         metadata)
+
+        # Scenarios without metadata, and missing scenarios, give empty results
+        self.assertEqual(config_manager.peek_scenario_metadata("test_scenario"), {})
+        self.assertEqual(config_manager.peek_scenario_metadata("nonexistent_scenario"), {})
+
+        # Peeking does not load the scenario
+        self.assertIsNone(config_manager.scenario_name)
+
     def test_list_available_scenarios(self):
         """Test listing available scenarios."""
         config_manager = ConfigurationManager(self.config_dir)
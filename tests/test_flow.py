@@ -0,0 +1,54 @@
+"""
+Tests for population flow functions.
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+from population import flow
+from population.flow import apply_flows
+
+
+class TestApplyFlows(unittest.TestCase):
+    """Test cases for the apply_flows kernel."""
+    
+    def setUp(self):
+        """Set up populations and rates for three states and two flows."""
+        self.populations = np.array([[1000, 0, 0], [37, 5, 0], [0, 0, 9]], dtype=np.int64)
+        self.source_idx = [0, 1]
+        self.target_idx = [1, 2]
+        self.rates = np.array([[0.1, 0.8], [0.55, 1.0], [0.3, 0.2]])
+    
+    def test_apply_flows(self):
+        """Test that flows are applied in order and truncated toward zero."""
+        moved, available = apply_flows(self.populations, self.source_idx,
+                                       self.target_idx, self.rates)
+        
+        self.assertEqual(moved.tolist(), [[100, 80], [20, 25], [0, 0]])
+        self.assertEqual(available.tolist(), [[1000, 100], [37, 25], [0, 0]])
+        self.assertEqual(self.populations.tolist(), [[900, 20, 80], [17, 0, 25], [0, 0, 9]])
+    
+    def test_numpy_fallback_matches_loop(self):
+        """Test that the NumPy path matches the per-segment loop."""
+        rng = np.random.default_rng(0)
+        populations = rng.integers(0, 10000, size=(50, 5))
+        rates = rng.uniform(0.0, 1.0, size=(50, 4))
+        source_idx = [0, 1, 2, 3]
+        target_idx = [1, 2, 3, 4]
+        
+        expected = populations.copy()
+        expected_moved = np.zeros((50, 4), dtype=np.int64)
+        expected_available = np.zeros((50, 4), dtype=np.int64)
+        flow._apply_flows_loop(expected, source_idx, target_idx, rates,
+                               expected_moved, expected_available)
+        
+        with mock.patch.object(flow, '_apply_flows_jit', None):
+            moved, available = apply_flows(populations, source_idx, target_idx, rates)
+        
+        np.testing.assert_array_equal(populations, expected)
+        np.testing.assert_array_equal(moved, expected_moved)
+        np.testing.assert_array_equal(available, expected_available)
+
+
+if __name__ == '__main__':
+    unittest.main()
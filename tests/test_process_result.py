@@ -0,0 +1,66 @@
+"""
+Tests for ProcessResult class.
+"""
+
+import unittest
+import datetime
+from core.time_manager import TimeManager
+from process.process_result import ProcessResult
+from stats.statistics_tracker import StatisticsTracker
+
+
+class TestProcessResult(unittest.TestCase):
+    """Test cases for recording ProcessResult objects in a StatisticsTracker."""
+
+    def setUp(self):
+        """Set up results with explicit and segment-derived dimensions."""
+        self.time_manager = TimeManager(datetime.date(2025, 4, 1))
+
+        explicit = ProcessResult('eligible', 'applied', 100, success_count=30,
+                                 segment_id='test_segment', flow_id='application',
+                                 region_id='on', cohort_type='kids', age_bracket='0-17')
+        explicit.add_financial_impact(50.0, 40.0, 10.0)
+        derived = ProcessResult('eligible', 'applied', 40, success_count=12,
+                                segment_id='general_65+_region1', flow_id='application')
+        derived.add_financial_impact(20.0, 20.0, 0.0)
+        self.results = [explicit, derived]
+
+    def test_single_result_totals_recorded_once(self):
+        """Test that results added one at a time share a single total record."""
+        tracker = StatisticsTracker()
+        for segment_id, count in [('general_18-64_region1', 30), ('general_65+_region1', 12)]:
+            result = ProcessResult('eligible', 'applied', 100, success_count=count,
+                                   segment_id=segment_id, flow_id='application')
+            result.add_financial_impact(50.0, 40.0, 10.0)
+            result.add_to_statistics(tracker, self.time_manager)
+
+        totals = [m for m in tracker.metrics if m['segment'] == 'ALL']
+        self.assertEqual(sorted((m['type'], m['id'], m['value']) for m in totals), [
+            ('financial', 'claim_expenditure', 100.0),
+            ('financial', 'patient_expenditure', 20.0),
+            ('financial', 'program_expenditure', 80.0),
+            ('flow', 'application', 42)
+        ])
+
+    def test_add_many_matches_add_to_statistics(self):
+        """Test that a batch call records the same metrics as single calls."""
+        single = StatisticsTracker()
+        for result in self.results:
+            result.add_to_statistics(single, self.time_manager)
+
+        batch = StatisticsTracker()
+        ProcessResult.add_many_to_statistics(self.results, batch, self.time_manager)
+
+        def record_key(metric):
+            return tuple(sorted(metric.items()))
+
+        self.assertEqual(sorted(map(record_key, batch.metrics)),
+                         sorted(map(record_key, single.metrics)))
+        self.assertEqual(batch._metric_cache, single._metric_cache)
+        self.assertIn({'type': 'flow', 'id': 'application', 'period': '2025-04',
+                       'region': 'on', 'cohort': 'kids', 'age_bracket': '0-17',
+                       'segment': 'test_segment', 'value': 30}, batch.metrics)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for Region class.
+"""
+
+import unittest
+import datetime
+import numpy as np
+from population.region import Region
+
+
+class TestRegion(unittest.TestCase):
+    """Test cases for the Region class."""
+
+    def setUp(self):
+        """Set up a region with two segments."""
+        self.state_definitions = {
+            state_id: {'id': state_id, 'name': state_id}
+            for state_id in ['eligible', 're_enrollment_eligible', 'applied',
+                             'enrolled_inactive', 'active_claimant']
+        }
+        self.segment_definitions = [
+            {'segment_id': 'segment1', 'region_id': 'region1', 'population_size': 1000},
+            {'segment_id': 'segment2', 'region_id': 'region1', 'population_size': 500},
+            {'segment_id': 'segment3', 'region_id': 'region2', 'population_size': 200}
+        ]
+
+        self.region = Region('region1', 'Region 1')
+        self.region.initialize_segments(self.segment_definitions, self.state_definitions)
+
+    def test_populations_array(self):
+        """Test that segment states read and write the region's population array."""
+        self.assertEqual(self.region.state_ids, list(self.state_definitions))
+        self.assertEqual(self.region.populations.tolist(),
+                         [[1000, 0, 0, 0, 0], [500, 0, 0, 0, 0]])
+
+        segment = self.region.population_segments[1]
+        segment.transition_population('eligible', 'applied', 200)
+        self.assertEqual(self.region.populations[1].tolist(), [300, 0, 200, 0, 0])
+
+        self.region.populations[0, 3] = 7
+        self.assertEqual(self.region.population_segments[0].get_state_population(
+            'enrolled_inactive'), 7)
+
+        stats = self.region.calculate_regional_statistics()
+        self.assertEqual(stats['state_populations']['eligible'], 1300)
+        self.assertEqual(stats['state_populations']['applied'], 200)
+
+    def test_add_population_segment_keeps_populations(self):
+        """Test that adding a segment keeps the populations already recorded."""
+        self.region.population_segments[0].transition_population('eligible', 'applied', 100)
+
+        other = Region('region2', 'Region 2')
+        other.initialize_segments(self.segment_definitions, self.state_definitions)
+        self.region.add_population_segment(other.population_segments[0])
+
+        self.assertEqual(self.region.populations.tolist(),
+                         [[900, 0, 100, 0, 0], [500, 0, 0, 0, 0], [200, 0, 0, 0, 0]])
+
+    def test_get_segment_by_id(self):
+        """Test looking up segments by identifier."""
+        segment = self.region.get_segment_by_id('segment2')
+
+        self.assertIs(segment, self.region.population_segments[1])
+        self.assertIsNone(self.region.get_segment_by_id('segment3'))
+
+    def test_record_state_history(self):
+        """Test that state history is recorded as array snapshots."""
+        segment = self.region.population_segments[0]
+        self.region.record_state_history('2025-04')
+        segment.transition_population('eligible', 'applied', 250)
+        self.region.record_state_history('2025-05')
+
+        history = self.region.get_state_history()
+        self.assertEqual(history['periods'], ['2025-04', '2025-05'])
+        self.assertEqual(history['segments'], ['segment1', 'segment2'])
+        self.assertEqual(history['values'][:, 0, 0].tolist(), [1000, 750])
+
+        self.assertEqual(segment.states['applied'].get_historical_value('2025-04'), 0)
+        self.assertEqual(segment.states['applied'].get_historical_value('2025-05'), 250)
+        self.assertIsNone(segment.states['applied'].get_historical_value('2025-06'))
+
+    def test_apply_regional_factors(self):
+        """Test adjusting dictionaries and arrays of rates."""
+        self.region.regional_factors['flow'] = 0.5
+
+        self.assertEqual(self.region.apply_regional_factors({'a': 0.4, 'b': 'x'}, 'flow'),
+                         {'a': 0.2, 'b': 'x'})
+        self.assertEqual(self.region.apply_regional_factors(np.array([0.4, 0.8]), 'flow').tolist(),
+                         [0.2, 0.4])
+        self.assertEqual(self.region.apply_regional_factors(np.array([0.4]), 'other').tolist(),
+                         [0.4])
+
+    def test_reset_annual_states(self):
+        """Test that resettable states move to re-enrollment eligible."""
+        self.state_definitions['enrolled_inactive']['reset_on_fiscal_year'] = True
+        self.state_definitions['active_claimant']['reset_on_fiscal_year'] = True
+        region = Region('region1', 'Region 1')
+        region.initialize_segments(self.segment_definitions, self.state_definitions)
+        region.populations[:, 3] = [10, 20]
+        region.populations[0, 4] = 5
+
+        reset_results = region.reset_annual_states()
+
+        self.assertEqual(reset_results, {
+            'segment1': {'enrolled_inactive': 10, 'active_claimant': 5},
+            'segment2': {'enrolled_inactive': 20, 'active_claimant': 0}
+        })
+        self.assertEqual(region.populations.tolist(),
+                         [[1000, 15, 0, 0, 0], [500, 20, 0, 0, 0]])
+
+    def test_string_eligibility_start_date(self):
+        """Test that segments accept eligibility start dates given as strings."""
+        self.segment_definitions[0]['eligibility_start_date'] = '2025-06-01'
+        region = Region('region1', 'Region 1')
+        region.initialize_segments(self.segment_definitions, self.state_definitions)
+
+        age_bracket = region.population_segments[0].age_bracket
+        self.assertEqual(age_bracket.eligibility_start_date, datetime.date(2025, 6, 1))
+        self.assertFalse(age_bracket.is_eligible(datetime.date(2025, 5, 31)))
+        self.assertTrue(age_bracket.is_eligible(datetime.date(2025, 6, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
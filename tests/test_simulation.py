@@ -3,6 +3,8 @@ Tests for Simulation class.
 """
 
 import os
+import csv
+import json
 import unittest
 import tempfile
 import yaml
@@ -198,6 +200,116 @@ class TestSimulation(unittest.TestCase):
         derived_metrics = [m for m in results['metrics'] if m['type'] == 'derived']
         self.assertTrue(len(derived_metrics) > 0, "No derived metrics found")
     
+    def test_flow_totals_recorded_once_per_period(self):
+        """Test that each flow has a single total record per period."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        results = self.simulation.run_simulation()
+
+        total_keys = [(m['id'], m['period']) for m in results['metrics']
+                      if m['type'] == 'flow' and m['segment'] == 'ALL']
+
+        self.assertTrue(len(total_keys) > 0)
+        self.assertEqual(len(total_keys), len(set(total_keys)))
+
+        # Totals match the sum of segment-level records
+        for flow_id, period in set(total_keys):
+            segment_sum = sum(m['value'] for m in results['metrics']
+                              if m['type'] == 'flow' and m['id'] == flow_id and
+                                 m['period'] == period and m['segment'] != 'ALL')
+            total = [m['value'] for m in results['metrics']
+                     if m['type'] == 'flow' and m['id'] == flow_id and
+                        m['period'] == period and m['segment'] == 'ALL'][0]
+            self.assertEqual(total, segment_sum)
+
+    def test_process_time_period_results(self):
+        """Test that returned process results match the recorded flow metrics."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        
+        period_results = self.simulation.process_time_period()
+        results = period_results['results']
+        
+        self.assertTrue(len(results) > 0)
+        flow_metrics = [m for m in self.simulation.statistics_tracker.get_metrics_by_type('flow')
+                        if m['segment'] != 'ALL']
+        self.assertEqual(sorted((m['id'], m['segment'], m['value']) for m in flow_metrics),
+                         sorted((r.flow_id, r.segment_id, r.success_count) for r in results))
+    
+    def test_state_metrics_recorded_once_per_period(self):
+        """Test that state metrics are not duplicated for the first period."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        results = self.simulation.run_simulation()
+        
+        state_keys = [(m['id'], m['period'], m['region'], m['cohort'],
+                       m['age_bracket'], m['segment'])
+                      for m in results['metrics'] if m['type'] == 'state']
+        
+        self.assertEqual(len(state_keys), len(set(state_keys)))
+    
+    def test_get_state_history(self):
+        """Test recording state history as a periods x segments x states array."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        self.simulation.run_simulation()
+
+        history = self.simulation.get_state_history()
+
+        self.assertEqual(history['periods'], ['2025-04', '2025-05', '2025-06'])
+        self.assertEqual(history['segments'], ['test_segment'])
+        self.assertEqual(history['values'].shape, (3, 1, 5))
+
+        # Population is conserved across states in every period
+        self.assertTrue((history['values'].sum(axis=2) == 1000).all())
+
+        # Eligible population decreases as people apply
+        eligible = history['values'][:, 0, history['states'].index('eligible')]
+        self.assertTrue((eligible[1:] < eligible[:-1]).all())
+
+    def test_state_historical_values(self):
+        """Test that per-state history is recorded for every period of a run."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        self.simulation.run_simulation()
+        
+        history = self.simulation.get_state_history()
+        segment = self.simulation.regions[0].population_segments[0]
+        
+        for i, period in enumerate(history['periods']):
+            for j, state_id in enumerate(history['states']):
+                self.assertEqual(segment.states[state_id].get_historical_value(period),
+                                 history['values'][i, 0, j])
+        self.assertGreater(segment.states['applied'].get_historical_value('2025-05'), 0)
+    
+    def test_parallel_regions_match_serial(self):
+        """Test that processing regions on threads gives the serial results."""
+        scenario = {
+            'regions': [
+                {'region_id': 'north', 'region_name': 'North'},
+                {'region_id': 'south', 'region_name': 'South'}
+            ],
+            'population_segments': [
+                {'segment_id': 'north_all', 'cohort_type': 'test_cohort', 'region_id': 'north',
+                 'age_bracket_name': 'all', 'population_size': 1000},
+                {'segment_id': 'south_all', 'cohort_type': 'test_cohort', 'region_id': 'south',
+                 'age_bracket_name': 'all', 'population_size': 2500}
+            ]
+        }
+        with open(os.path.join(self.config_dir, "scenarios", "two_regions.yaml"), 'w') as file:
+            yaml.dump(scenario, file)
+        
+        results = []
+        for max_workers in (None, 2):
+            simulation = Simulation(self.start_date, self.end_date, 'MONTHLY',
+                                    self.config_dir, max_workers=max_workers)
+            simulation.load_configuration("two_regions")
+            simulation.initialize_simulation()
+            results.append(simulation.run_simulation()['metrics'])
+            self.assertIsNone(simulation._executor)
+        
+        self.assertEqual(results[0], results[1])
+    
     def test_get_simulation_results(self):
         """Test getting simulation results."""
         self.simulation.load_configuration("test_simulation")
@@ -207,6 +319,7 @@ class TestSimulation(unittest.TestCase):
         results = self.simulation.get_simulation_results()
         
         self.assertIsNotNone(results)
+        self.assertIs(self.simulation.get_simulation_results(), results)
         self.assertIn('simulation_params', results)
         self.assertEqual(results['simulation_params']['scenario'], 'test_simulation')
         self.assertEqual(results['simulation_params']['start_date'], self.start_date.isoformat())
@@ -228,6 +341,65 @@ class TestSimulation(unittest.TestCase):
             self.assertIn('segment', metric)
             self.assertIn('value', metric)
     
+    def test_export_results_json(self):
+        """Test that exported JSON round-trips to the simulation results."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        results = self.simulation.run_simulation()
+        
+        file_paths = self.simulation.export_results(
+            os.path.join(self.config_dir, "results"), ['json']
+        )
+        
+        with open(file_paths['json']) as file:
+            exported = json.load(file)
+        
+        self.assertEqual(exported['simulation_params'], results['simulation_params'])
+        self.assertEqual(exported['metrics'], results['metrics'])
+    
+    def test_export_results_ndjson(self):
+        """Test that metrics are exported one JSON record per line."""
+        self.simulation.load_configuration("test_simulation")
+        self.simulation.initialize_simulation()
+        results = self.simulation.run_simulation()
+        
+        file_paths = self.simulation.export_results(
+            os.path.join(self.config_dir, "results"), ['ndjson']
+        )
+        
+        with open(file_paths['ndjson']) as file:
+            exported = [json.loads(line) for line in file]
+        
+        self.assertEqual(exported, results['metrics'])
+    
+    def test_export_results_params_csv(self):
+        """Test that simulation parameters are exported as quoted CSV."""
+        scenarios_dir = os.path.join(self.config_dir, "scenarios")
+        os.rename(os.path.join(scenarios_dir, "test_simulation.yaml"),
+                  os.path.join(scenarios_dir, "test, with comma.yaml"))
+        self.simulation.load_configuration("test, with comma")
+        self.simulation.initialize_simulation()
+        self.simulation.run_simulation()
+        
+        file_paths = self.simulation.export_results(
+            os.path.join(self.config_dir, "results"), ['csv']
+        )
+        
+        with open(file_paths['csv']['params'], newline='') as file:
+            rows = list(csv.reader(file))
+        
+        self.assertEqual(rows[0], ['parameter', 'value'])
+        self.assertIn(['scenario', 'test, with comma'], rows)
+        self.assertIn(['start_date', '2025-04-01'], rows)
+        
+        # Metric files hold one row per metric of their type
+        with open(file_paths['csv']['state'], newline='') as file:
+            rows = list(csv.reader(file))
+        
+        state_metrics = self.simulation.statistics_tracker.get_metrics_by_type('state')
+        self.assertEqual(rows[0], list(state_metrics[0].keys()))
+        self.assertEqual(len(rows) - 1, len(state_metrics))
+    
     def test_metric_filtering(self):
         """Test filtering metrics by various dimensions."""
         self.simulation.load_configuration("test_simulation")
@@ -5,7 +5,7 @@ Tests for TimeManager class.
 import unittest
 import datetime
 from dateutil.relativedelta import relativedelta
-from core.time_manager import TimeManager, TimeInterval
+from core.time_manager import TimeManager, TimeInterval, _add_months
 
 
 class TestTimeManager(unittest.TestCase):
@@ -69,6 +69,20 @@ class TestTimeManager(unittest.TestCase):
         self.assertEqual(tm.current_date, expected_date)
         self.assertTrue(fiscal_transition)
     
+    def test_advance_time_month_end(self):
+        """Test that advancing from a month end matches relativedelta."""
+        for start_date in (datetime.date(2025, 1, 31), datetime.date(2024, 2, 29),
+                           datetime.date(2025, 11, 30)):
+            for months in (1, 3, 12, 25):
+                self.assertEqual(_add_months(start_date, months),
+                                 start_date + relativedelta(months=months))
+        
+        # Fiscal year transitions are still detected across several years
+        tm = TimeManager(datetime.date(2025, 1, 31), TimeInterval.MONTHLY)
+        transitions = [tm.advance_time() for _ in range(36)]
+        self.assertEqual(sum(transitions), 3)
+        self.assertEqual(tm.fiscal_year_start_date, datetime.date(2027, 4, 1))
+    
     def test_is_fiscal_year_start(self):
         """Test checking for fiscal year start date."""
         # Initialize on fiscal year start
@@ -96,6 +110,15 @@ class TestTimeManager(unittest.TestCase):
         # Annual
         tm = TimeManager(datetime.date(2025, 4, 1), TimeInterval.ANNUAL)
         self.assertEqual(tm.get_current_period(), "2025")
+        
+        # Precomputed periods up to an end date
+        tm = TimeManager(datetime.date(2025, 11, 1), TimeInterval.MONTHLY,
+                         end_date=datetime.date(2026, 2, 28))
+        periods = []
+        for _ in range(5):
+            periods.append(tm.get_current_period())
+            tm.advance_time()
+        self.assertEqual(periods, ["2025-11", "2025-12", "2026-01", "2026-02", "2026-03"])
     
     def test_get_months_since(self):
         """Test calculating months between dates."""
@@ -111,6 +134,13 @@ class TestTimeManager(unittest.TestCase):
         
         # Test with string date
         self.assertEqual(tm.get_months_since("2025-04-15"), 3)
+        
+        # Only whole months are counted, matching relativedelta
+        for reference_date in (datetime.date(2025, 4, 16), datetime.date(2025, 9, 14),
+                               datetime.date(2024, 2, 29), datetime.date(2025, 7, 15)):
+            delta = relativedelta(tm.current_date, reference_date)
+            self.assertEqual(tm.get_months_since(reference_date),
+                             delta.years * 12 + delta.months)
     
     def test_get_current_fiscal_year(self):
         """Get the current fiscal year identifier using start year convention."""